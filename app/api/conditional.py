@@ -0,0 +1,36 @@
+"""Conditional GET helpers: strong ETags and ``If-None-Match`` -> 304.
+
+An ETag is a digest of whatever determines the response body (a row's
+``updated_at``, an owner's write version plus the query string, ...), so
+freshness can be checked before loading or serializing anything.
+"""
+
+import hashlib
+from fastapi import Request, Response
+from starlette import status
+
+# Browsers may keep the body but must revalidate before reusing it
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match covers ``etag`` (weak comparison, per RFC 9110)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
@@ -4,11 +4,12 @@ from app.db.session import SessionLocal
 
 from fastapi import Depends, HTTPException, status, Cookie
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import JWTError
 from app.core.config import settings
+from app.core.security import decode_access_token
 from app.schemas.user import TokenData
 from app.models.user import User
-from sqlalchemy import select
+from app.services.users import get_user_cached
 from uuid import UUID
 
 # Make the OAuth2 dependency non-fatal so we can fall back to cookie-based sessions.
@@ -38,15 +39,13 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(raw_token, settings.SECRET_KEY, algorithms=[settings.ACCESS_TOKEN_ALGORITHM])
-        sub = payload.get("sub")
+        sub = decode_access_token(raw_token)  # signature checked once per token, then cached
         if sub is None:
             raise credentials_exc
         user_id = UUID(sub)
     except (JWTError, ValueError):
         raise credentials_exc
-    res = await db.execute(select(User).where(User.id == user_id))
-    user = res.scalar_one_or_none()
+    user = await get_user_cached(db, user_id)
     if user is None:
         raise credentials_exc
     return user
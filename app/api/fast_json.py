@@ -0,0 +1,64 @@
+"""Fast-path JSON for hot read endpoints.
+
+Ideas and admin user rows are turned straight into dicts (field lists taken
+from the response models, so they stay in sync) and encoded with orjson,
+skipping Pydantic validation of data that came from the database. Routes keep
+their ``response_model`` for OpenAPI; the bytes match what Pydantic would
+produce for the same rows (see app.scripts.bench_serialization).
+"""
+
+from operator import attrgetter, itemgetter
+from typing import Any
+import orjson
+from fastapi import Response
+from app.schemas.idea import IdeaOut
+from app.schemas.user import UserAdminOut, UserPublic
+
+_IDEA_FIELDS = tuple(name for name in IdeaOut.model_fields if name not in ("owner", "snippet"))
+_OWNER_FIELDS = tuple(UserPublic.model_fields)
+_USER_ADMIN_FIELDS = tuple(UserAdminOut.model_fields)
+_idea_getters = (itemgetter(*_IDEA_FIELDS), attrgetter(*_IDEA_FIELDS))
+_owner_getters = (itemgetter(*_OWNER_FIELDS), attrgetter(*_OWNER_FIELDS))
+_user_admin_getters = (itemgetter(*_USER_ADMIN_FIELDS), attrgetter(*_USER_ADMIN_FIELDS))
+
+# Pydantic writes UTC datetimes with a "Z" suffix
+_OPTIONS = orjson.OPT_UTC_Z
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=_OPTIONS)
+
+
+def json_response(content: Any, **kwargs) -> Response:
+    return Response(dumps(content), media_type="application/json", **kwargs)
+
+
+def _values(obj, getters) -> tuple:
+    # Loaded ORM attributes sit in the instance __dict__; reading them there
+    # skips the instrumented descriptors. Anything unloaded (or a __slots__
+    # object like CachedIdea) goes through normal attribute access.
+    by_key, by_attr = getters
+    try:
+        return by_key(obj.__dict__)
+    except (AttributeError, KeyError):
+        return by_attr(obj)
+
+
+def owner_dict(user) -> dict | None:
+    if user is None:
+        return None
+    return dict(zip(_OWNER_FIELDS, _values(user, _owner_getters)))
+
+
+def idea_dict(obj, *, with_owner: bool = True) -> dict:
+    """IdeaOut-shaped dict of an Idea (or CachedIdea); without the owner key if not ``with_owner``."""
+    item = dict(zip(_IDEA_FIELDS, _values(obj, _idea_getters)))
+    if with_owner:
+        item["owner"] = owner_dict(getattr(obj, "owner", None))
+    # snippet is a plain attribute, set only on search results
+    item["snippet"] = getattr(obj, "snippet", None)
+    return item
+
+
+def user_admin_dict(user) -> dict:
+    return dict(zip(_USER_ADMIN_FIELDS, _values(user, _user_admin_getters)))
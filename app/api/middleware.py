@@ -3,74 +3,88 @@ import logging
 import time
 import uuid
 from contextvars import ContextVar
-from typing import Callable
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
-from fastapi import Request, Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.logging import ACCESS_LOGGER, keep_access_line
 
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="-")
 
 # Two loggers: one generic 'app' and a special 'app.request' for access lines
 app_log = logging.getLogger("app")
-access_log = logging.getLogger("app.request")
+access_log = logging.getLogger(ACCESS_LOGGER)
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: ASGIApp, header_name: str = "X-Request-ID"):
-        super().__init__(app)
-        self.header_name = header_name
+# Sent in production (safe behind Cloudflare; clients see HSTS through it)
+SECURITY_HEADERS = (
+    ("X-Frame-Options", "DENY"),
+    ("X-Content-Type-Options", "nosniff"),
+    ("Referrer-Policy", "no-referrer"),
+    ("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload"),
+)
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        rid = request.headers.get(self.header_name, str(uuid.uuid4()))
-        token = request_id_ctx.set(rid)
-        try:
-            response = await call_next(request)
-        finally:
-            request_id_ctx.reset(token)
-        response.headers[self.header_name] = rid
-        return response
 
+class RequestContextMiddleware:
+    """Request ID, response headers and access log in one pure-ASGI layer.
+
+    Sets ``request_id_ctx`` (from the X-Request-ID header or a new uuid4) for
+    the whole request, echoes it on the response, optionally adds
+    :data:`SECURITY_HEADERS` (without overriding ones a route set) and logs
+    one ``app.request`` line when the response is complete (sampled, see
+    ``keep_access_line``). Wrapping ``send`` instead of
+    ``BaseHTTPMiddleware.call_next`` keeps streaming responses streaming and
+    avoids a task + memory stream per layer.
+    """
 
-# ...existing code...
+    def __init__(self, app: ASGIApp, *, header_name: str = "X-Request-ID", security_headers: bool = False):
+        self.app = app
+        self.header_name = header_name
+        self.security_headers = security_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
         start = time.perf_counter()
-        response: Response | None = None
+        rid = Headers(scope=scope).get(self.header_name) or str(uuid.uuid4())
+        status_code: int | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers[self.header_name] = rid
+                if self.security_headers:
+                    for name, value in SECURITY_HEADERS:
+                        headers.setdefault(name, value)
+            await send(message)
+
+        token = request_id_ctx.set(rid)
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
-            duration_ms = int((time.perf_counter() - start) * 1000)
-            rid = request_id_ctx.get()
             access_log.error(
-                f"Unhandled exception for {request.method} {request.url.path}: {exc}",
+                f"Unhandled exception for {scope['method']} {scope['path']}: {exc}",
                 exc_info=True,
-                extra={
-                    "request_id": rid,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": 500,
-                    "duration_ms": duration_ms,
-                    "client": request.client.host if request.client else "-",
-                },
+                extra=self._fields(scope, rid, 500, start),
             )
-            raise  # re-raise so FastAPI can handle it
+            raise  # re-raise so the app's exception handler answers
         finally:
-            if response is not None:
-                duration_ms = int((time.perf_counter() - start) * 1000)
-                # Prefer request ID from response header (set by RequestIDMiddleware),
-                # fall back to context var which might be reset to '-' by then.
-                rid = response.headers.get("X-Request-ID") or request_id_ctx.get()
-                status_code = response.status_code
-                access_log.info(
-                    "request",
-                    extra={
-                        "request_id": rid,
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": status_code,
-                        "duration_ms": duration_ms,
-                        "client": request.client.host if request.client else "-",
-                    },
-                )
-# ...existing code...
\ No newline at end of file
+            request_id_ctx.reset(token)
+        if status_code is not None:
+            fields = self._fields(scope, rid, status_code, start)
+            # sampled before a LogRecord is even created
+            if keep_access_line(status_code, fields["duration_ms"]):
+                access_log.info("request", extra=fields)
+
+    @staticmethod
+    def _fields(scope: Scope, rid: str, status_code: int, start: float) -> dict:
+        client = scope.get("client")
+        return {
+            "request_id": rid,
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "duration_ms": int((time.perf_counter() - start) * 1000),
+            "client": client[0] if client else "-",
+        }
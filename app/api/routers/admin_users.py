@@ -3,8 +3,10 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
 from app.api.deps import get_db, require_superuser
+from app.api.fast_json import json_response, user_admin_dict
 from app.schemas.user import UserAdminOut, UserAdminUpdate
 from app.services.users import list_users, update_user_admin, delete_user
+from app.services.pagination import CountMode
 
 router = APIRouter()
 
@@ -14,13 +16,19 @@ async def admin_list_users(
     offset: int = Query(0, ge=0),
     q: str | None = Query(None, description="Search email/full_name"),
     is_active: bool | None = Query(None),
+    fuzzy: bool = Query(False, description="Also match misspellings of q (trigram similarity)"),
+    similarity: float = Query(0.3, ge=0.0, le=1.0, description="Fuzzy match threshold (0..1)"),
+    count: CountMode = Query(CountMode.exact, description="total: exact, planner estimate, or none (use has_more)"),
     db: AsyncSession = Depends(get_db),
     _admin = Depends(require_superuser),
 ):
-    items, total = await list_users(db, limit=limit, offset=offset, q=q, is_active=is_active)
-    # Convert SQLAlchemy models to Pydantic schemas
-    items_out = [UserAdminOut.model_validate(item) for item in items]
-    return {"items": items_out, "total": total, "limit": limit, "offset": offset}
+    items, total, has_more = await list_users(
+        db, limit=limit, offset=offset, q=q, is_active=is_active, fuzzy=fuzzy, similarity=similarity,
+        count=count.value,
+    )
+    # UserAdminOut-shaped dicts straight from the rows (no per-item validation)
+    items_out = [user_admin_dict(item) for item in items]
+    return json_response({"items": items_out, "total": total, "limit": limit, "offset": offset, "has_more": has_more})
 
 @router.patch("/{user_id}", response_model=UserAdminOut)
 async def admin_update_user(
@@ -11,7 +11,7 @@ from app.schemas.user import (
 from app.services.users import (
     get_by_email, create_user, authenticate, set_user_password, update_profile,
     change_password, create_password_reset_token, reset_password_with_token,
-    issue_email_verification, verify_email_with_token)
+    issue_email_verification, verify_email_with_token, invalidate_user)
 from sqlalchemy import select
 from datetime import datetime, timezone
 from app.models.email_verification import EmailVerificationToken
@@ -83,6 +83,7 @@ async def verify_email_post(payload: VerifyEmailIn, db: AsyncSession = Depends(g
     user.is_verified = True
     evt.used_at = now
     await db.commit()
+    invalidate_user(user.id)
     return VerifyEmailOut(message="Email verified. You can sign in now.")
 
 @router.post("/token", response_model=Token)
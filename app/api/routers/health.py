@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.api.deps import get_db
+from app.api.deps import get_db, require_superuser
 from datetime import datetime, timezone
 from sqlalchemy import text
 import socket
+from app.core.cache import cache_stats
+from app.core.logging import log_queue_stats
 import logging
 
 logger = logging.getLogger(__name__)
@@ -28,3 +30,15 @@ async def health_check(db: AsyncSession = Depends(get_db)):
         "host": socket.gethostname(),
         "db": db_status
     }
+
+@router.get("/metrics", summary="In-process cache and logging metrics", dependencies=[Depends(require_superuser)])
+async def metrics():
+    """
+    Hit/miss counters and memory use of the in-process caches, and the
+    log queue depth / overflow drops. Superusers only.
+    """
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "caches": cache_stats(),
+        "logging": log_queue_stats(),
+    }
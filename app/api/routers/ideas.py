@@ -1,68 +1,432 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import csv
+import io
+import json
+import time
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.deps import get_db, get_current_user, require_verified
-from app.schemas.idea import IdeaCreate, IdeaOut, IdeaUpdate, MessageResponse, IdeasPage, ALLOWED_TAGS
-from app.services.ideas import create, get, list_, update_, delete_, add_tags, remove_tags
+from pydantic import ValidationError
+from uuid import UUID
+from app.schemas.idea import (
+    IdeaCreate, IdeaOut, IdeaUpdate, MessageResponse, IdeasPage, IdeasCompactPage,
+    IdeaBatchIn, IdeaBatchDeleteIn, IdeaBatchOut, IdeaBase, IdeaImportOut, TagCountsOut, IdeaStatsOut, IdeaRankIn, IdeaRankOut,
+    IdeaCreatedOut, IdeaSimilarOut, IdeaDuplicateOut,
+    ALLOWED_TAGS, IDEA_LIST_FIELDS, IDEA_IMPORT_MAX_ERRORS)
+from app.services.ideas import (
+    create, get, list_, update_, delete_, add_tags, remove_tags,
+    create_many, update_many, delete_many, export_, import_, tag_counts, get_stats, get_many, similar, get_version,
+    idea_versions, EXPORT_COLUMNS)
+from app.services.ranking import default_weights, rank_ideas
+from app.services.file_formats import read_csv, read_ndjson, RowSpool
+from app.services import dedup
+from app.db.session import SessionLocal
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.api.fast_json import dumps, json_response, idea_dict, owner_dict
+from app.api.conditional import make_etag, etag_matches, not_modified, cache_headers
 from enum import Enum
 from app.models.user import User
+from app.models.idea_stats import STATS_BUCKETS, STATS_SCORE_MIN, STATS_SCORE_MAX
+from app.services.pagination import CountMode
 
 class IdeaSort(str, Enum):
     created_at = "created_at"
     score = "score"
+    relevance = "relevance"  # full-text rank, requires q
+
+class IdeaMatch(str, Enum):
+    fts = "fts"          # full-text over title + description
+    trigram = "trigram"  # title substring / typo-tolerant
+
+class TagsMode(str, Enum):
+    any = "any"  # ideas having at least one of ?tags
+    all = "all"  # ideas having every one of ?tags
 
 class IdeaOrder(str, Enum):
     asc = "asc"
     desc = "desc"
 
+class IdeaFileFormat(str, Enum):  # /ideas/export and /ideas/import
+    ndjson = "ndjson"
+    csv = "csv"
+
 router = APIRouter()
 
-@router.post("/", response_model=IdeaOut, status_code=status.HTTP_201_CREATED)
-async def create_idea(payload: IdeaCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
-    data = payload.model_dump()
-    if not data["uses_ai"]:
+def _apply_ai_defaults(data: dict) -> dict:
+    # Ideas that don't use AI have no AI complexity (create and partial update)
+    if data.get("uses_ai") is False:
         data["ai_complexity"] = 0
+    return data
+
+def _validation_errors(exc: ValidationError) -> list[dict]:
+    return exc.errors(include_url=False, include_context=False, include_input=False)
+
+@router.post("/", response_model=IdeaCreatedOut, status_code=status.HTTP_201_CREATED)
+async def create_idea(
+    payload: IdeaCreate,
+    check_duplicates: bool = Query(False, description="Also list the caller's existing ideas that look like near-duplicates"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_verified),
+):
+    data = _apply_ai_defaults(payload.model_dump())
     data["owner_id"] = current_user.id
-    return await create(db, data, owner_id=current_user.id)
+    obj = await create(db, data, owner_id=current_user.id)
+    if not check_duplicates:
+        return obj
+    dupes = await dedup.find_similar(
+        db, owner_id=current_user.id, sig=dedup.signature(obj.title, obj.description), exclude_id=obj.id)
+    out = IdeaCreatedOut.model_validate(obj, from_attributes=True)
+    out.possible_duplicates = [IdeaDuplicateOut(id=iid, title=title, similarity=round(sim, 3)) for iid, title, sim in dupes]
+    return out
+
+def _tag_filters(tags: List[str] | None, mode: TagsMode) -> dict:
+    return {"tags_all": tags} if mode == TagsMode.all else {"tags_any": tags}
 
-@router.get("/", response_model=IdeasPage)
+def _parse_fields(raw: str) -> list[str]:
+    fields = [f.strip() for f in raw.split(",") if f.strip()]
+    unknown = [f for f in fields if f not in IDEA_LIST_FIELDS and f != "owner"]
+    if unknown or not fields:
+        allow = ", ".join((*IDEA_LIST_FIELDS, "owner"))
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {unknown}. Allowed: {allow}")
+    return fields
+
+def _list_columns(selected: list[str] | None) -> list[str] | None:
+    # Idea columns for list_; fields=owner alone still selects one, since an
+    # empty list would mean "no projection" (full rows)
+    if not selected:
+        return None
+    return [f for f in selected if f != "owner"] or ["id"]
+
+# Serialized list pages; a key embeds the owner's write version, so writes
+# make old entries unreachable and LRU/TTL reclaim them
+_list_cache = TTLCache(
+    "idea_list_responses", maxsize=4096, ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_bytes=settings.RESPONSE_CACHE_MAX_MB * 1024 * 1024,
+)
+
+@router.get("/", response_model=IdeasPage | IdeasCompactPage)
 async def list_ideas(
+    request: Request,
     limit: int = Query(20, ge=1, le=100, description="Max items to return"),
     offset: int = Query(0, ge=0, description="Items to skip"),
     sort: IdeaSort = Query(IdeaSort.created_at, description="Sort field"),
     order: IdeaOrder = Query(IdeaOrder.desc, description="Sort direction"),
-    q: str | None = Query(None, description="Search in title/description"),
+    q: str | None = Query(None, description="Full-text search in title/description (web search syntax)"),
     uses_ai: bool | None = Query(None, description="Filter by AI usage"),
     min_score: float | None = Query(None, ge=0, le=5, description="Min score (0..5)"),
     max_score: float | None = Query(None, ge=0, le=5, description="Max score (0..5)"),
-    tags: List[str] | None = Query(None, description="Match ANY of these tag slugs"),
+    tags: List[str] | None = Query(None, description="Filter by these tag slugs (see tags_mode)"),
+    tags_mode: TagsMode = Query(TagsMode.any, description="any: at least one of tags; all: every tag"),
+    cursor: str | None = Query(None, description="Opaque next_cursor from a previous page (keyset mode; offset is ignored)"),
+    highlight: bool = Query(False, description="Include a highlighted description snippet for q matches"),
+    match: IdeaMatch = Query(IdeaMatch.fts, description="How q matches: full-text or title trigram"),
+    similarity: float = Query(0.3, ge=0.0, le=1.0, description="Trigram match threshold (0..1)"),
+    count: CountMode = Query(CountMode.exact, description="total: exact, planner estimate, or none (use has_more)"),
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,title,description_preview,score"),
+    compact: bool = Query(False, description="Send the owner once at page level instead of in every item"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_verified),
 ):
     if (min_score is not None and max_score is not None) and (min_score > max_score):
         raise HTTPException(status_code=400, detail="min_score cannot be greater than max_score")
-    
-    items, total = await list_(
-        db, limit=limit, offset=offset, sort=sort, order=order,
-        q=q, uses_ai=uses_ai, min_score=min_score, max_score=max_score,
-        owner_id=current_user.id, tags_any=tags,
+    if sort == IdeaSort.relevance and not q:
+        raise HTTPException(status_code=400, detail="sort=relevance requires q")
+    selected = _parse_fields(fields) if fields is not None else None
+    columns = _list_columns(selected)
+
+    # Any write by this owner bumps the version; the owner is embedded in items.
+    # Versions are per process and only see writes through the ideas service,
+    # so the tag also rolls over every LIST_ETAG_WINDOW_SECONDS to pick up the
+    # rest (app.scripts.rescore, direct SQL).
+    params = (
+        limit, 0 if cursor else offset, sort.value, order.value, q, uses_ai, min_score, max_score,
+        tuple(sorted(set(tags))) if tags else None, tags_mode.value, cursor, highlight,
+        match.value, similarity, count.value, tuple(selected) if selected else None, compact,
+    )
+    window = int(time.time() // max(1, settings.LIST_ETAG_WINDOW_SECONDS))
+    etag = make_etag("ideas", current_user.id, idea_versions.get(current_user.id), window, current_user.updated_at, params)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    key = (current_user.id, etag)
+    body = _list_cache.get(key)
+    if body is None:
+        body = await _list_body(
+            db, current_user, selected, columns, limit=limit, offset=offset, sort=sort.value, order=order.value,
+            q=q, uses_ai=uses_ai, min_score=min_score, max_score=max_score,
+            **_tag_filters(tags, tags_mode), cursor=cursor, highlight=highlight,
+            match=match.value, similarity=similarity, count=count.value, compact=compact,
+        )
+        _list_cache.set(key, body, nbytes=len(body))
+    return Response(body, media_type="application/json", headers=cache_headers(etag))
+
+async def _list_body(db: AsyncSession, current_user: User, selected, columns, *, compact: bool, cursor, offset, limit, **filters) -> bytes:
+    try:
+        items, total, next_cursor = await list_(
+            db, limit=limit, offset=offset, owner_id=current_user.id, cursor=cursor,
+            fields=columns, with_owner=not (compact or selected), **filters,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    page = {
+        "total": total, "limit": limit,
+        "offset": 0 if cursor else offset, "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
+    # rows come from the database: build IdeasPage / IdeasCompactPage shapes directly
+    if selected is None and not compact:
+        return dumps({"items": [idea_dict(obj) for obj in items], **page})
+
+    # sparse / compact: items hold only what was asked for; the owner is the caller
+    owner = owner_dict(current_user)
+    if selected is None:
+        items = [idea_dict(obj, with_owner=False) for obj in items]
+    elif "owner" in selected and not compact:
+        items = [{**item, "owner": owner} for item in items]
+    if compact:
+        return dumps({"items": items, "owner": owner, **page})
+    return dumps({"items": items, **page})
+
+# ---------------- export (registered before /{idea_id}) ----------------
+_EXPORT_MEDIA_TYPES = {IdeaFileFormat.ndjson: "application/x-ndjson", IdeaFileFormat.csv: "text/csv; charset=utf-8"}
+
+def _json_default(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+def _ndjson_chunk(rows: Sequence) -> bytes:
+    lines = (json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=_json_default, separators=(",", ":")) for row in rows)
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return ";".join(value)  # tags as "a;b" so the file round-trips through import
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def _csv_chunk(rows: Sequence, header: bool = False) -> bytes:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows(map(_csv_value, row) for row in rows)
+    return buf.getvalue().encode("utf-8")
+
+async def _stream_export(fmt: IdeaFileFormat, owner_id: UUID, filters: dict) -> AsyncIterator[bytes]:
+    # Own session: request-scoped dependencies are closed before the body streams
+    async with SessionLocal() as db:
+        if fmt == IdeaFileFormat.csv:
+            yield _csv_chunk((), header=True)
+        async for rows in export_(db, owner_id=owner_id, **filters):
+            yield _ndjson_chunk(rows) if fmt == IdeaFileFormat.ndjson else _csv_chunk(rows)
+
+@router.get("/export", summary="Stream all matching ideas as NDJSON or CSV")
+async def export_ideas(
+    format: IdeaFileFormat = Query(IdeaFileFormat.ndjson, description="ndjson (one JSON object per line) or csv"),
+    q: str | None = Query(None, description="Full-text search in title/description (web search syntax)"),
+    uses_ai: bool | None = Query(None, description="Filter by AI usage"),
+    min_score: float | None = Query(None, ge=0, le=5, description="Min score (0..5)"),
+    max_score: float | None = Query(None, ge=0, le=5, description="Max score (0..5)"),
+    tags: List[str] | None = Query(None, description="Filter by these tag slugs (see tags_mode)"),
+    tags_mode: TagsMode = Query(TagsMode.any, description="any: at least one of tags; all: every tag"),
+    match: IdeaMatch = Query(IdeaMatch.fts, description="How q matches: full-text or title trigram"),
+    similarity: float = Query(0.3, ge=0.0, le=1.0, description="Trigram match threshold (0..1)"),
+    current_user: User = Depends(require_verified),
+):
+    if (min_score is not None and max_score is not None) and (min_score > max_score):
+        raise HTTPException(status_code=400, detail="min_score cannot be greater than max_score")
+    filters = dict(q=q, uses_ai=uses_ai, min_score=min_score, max_score=max_score,
+                   match=match.value, similarity=similarity, **_tag_filters(tags, tags_mode))
+    return StreamingResponse(
+        _stream_export(format, current_user.id, filters),
+        media_type=_EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="ideas.{format.value}"'},
     )
-    return {"items": items, "total": total, "limit": limit, "offset": offset}
+
+# ---------------- import ----------------
+# Rows COPY'd per chunk
+_IMPORT_CHUNK_ROWS = 5000
+# Validated rows beyond this are spooled to a temp file until the COPY
+_IMPORT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+async def _capped(chunks: AsyncIterator[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    received = 0
+    async for chunk in chunks:
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(status_code=413, detail=f"Upload larger than {settings.IMPORT_MAX_MB} MB")
+        yield chunk
+
+# CSV blanks mean "use the default" for fields that have one (uses_ai, tags)
+_IDEA_OPTIONAL_FIELDS = frozenset(name for name, f in IdeaBase.model_fields.items() if not f.is_required())
+
+@router.post("/import", response_model=IdeaImportOut, summary="Bulk import ideas from streamed CSV or NDJSON")
+async def import_ideas(
+    request: Request,
+    format: IdeaFileFormat | None = Query(None, description="ndjson or csv; defaults from Content-Type"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_verified),
+):
+    if format is None:
+        is_csv = "csv" in request.headers.get("content-type", "")
+        format = IdeaFileFormat.csv if is_csv else IdeaFileFormat.ndjson
+    reader = read_csv if format == IdeaFileFormat.csv else read_ndjson
+    max_bytes = settings.IMPORT_MAX_MB * 1024 * 1024
+    if int(request.headers.get("content-length") or 0) > max_bytes:
+        raise HTTPException(status_code=413, detail=f"Upload larger than {settings.IMPORT_MAX_MB} MB")
+    errors: list[dict] = []
+    counts = {"received": 0, "failed": 0}
+
+    def fail(line: int, errs: list[dict]) -> None:
+        counts["failed"] += 1
+        if len(errors) < IDEA_IMPORT_MAX_ERRORS:
+            errors.append({"line": line, "errors": errs})
+
+    # Authentication may have checked out a connection: hand it back so a
+    # slow upload doesn't pin a pool slot while it is parsed
+    await db.close()
+    started = time.perf_counter()
+    with RowSpool(max_memory=_IMPORT_SPOOL_MEMORY_BYTES) as spool:
+        async for line, row, error in reader(_capped(request.stream(), max_bytes)):
+            counts["received"] += 1
+            if row is None:
+                fail(line, [{"loc": [], "msg": error}])
+                continue
+            if format == IdeaFileFormat.csv:
+                row = {k: v for k, v in row.items() if not (v in ("", []) and k in _IDEA_OPTIONAL_FIELDS)}
+            try:
+                spool.append(_apply_ai_defaults(IdeaBase.model_validate(row).model_dump()))
+            except ValidationError as exc:
+                fail(line, _validation_errors(exc))
+        # the whole body is in: the transaction only spans the COPY and the merge
+        imported = await import_(db, spool.chunks(_IMPORT_CHUNK_ROWS), owner_id=current_user.id) if spool.rows else 0
+    elapsed = time.perf_counter() - started
+    return {
+        **counts, "imported": imported,
+        "errors": errors, "errors_truncated": counts["failed"] > len(errors),
+        "elapsed_ms": int(elapsed * 1000),
+        "rows_per_sec": round(imported / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+# ---------------- what-if ranking ----------------
+@router.post("/rank", response_model=IdeaRankOut, summary="Top ideas under caller-supplied scoring weights")
+async def rank_ideas_route(payload: IdeaRankIn, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
+    overrides = payload.model_dump(exclude={"k", "uses_ai"}, exclude_none=True)
+    weights = {**default_weights(), **overrides}
+    ranked, considered = await rank_ideas(db, owner_id=current_user.id, weights=weights, k=payload.k, uses_ai=payload.uses_ai)
+    objs = await get_many(db, [iid for iid, _ in ranked], owner_id=current_user.id)
+    items = [
+        {**IdeaOut.model_validate(objs[iid]).model_dump(), "rank": i, "what_if_score": score}
+        for i, (iid, score) in enumerate(ranked, start=1) if iid in objs
+    ]
+    return {"weights": weights, "considered": considered, "items": items}
+
+# ---------------- batch writes (registered before /{idea_id}) ----------------
+@router.post("/batch", response_model=IdeaBatchOut, summary="Create many ideas in one transaction")
+async def create_ideas_batch(payload: IdeaBatchIn, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
+    results: list[dict] = []
+    valid: list[tuple[int, dict]] = []
+    for i, raw in enumerate(payload.items):
+        try:
+            valid.append((i, _apply_ai_defaults(IdeaCreate.model_validate(raw).model_dump())))
+        except ValidationError as exc:
+            results.append({"index": i, "status": "invalid", "errors": _validation_errors(exc)})
+    created = await create_many(db, [data for _, data in valid], owner_id=current_user.id)
+    for (i, _), obj in zip(valid, created):
+        results.append({"index": i, "status": "created", "id": obj.id, "item": obj})
+    results.sort(key=lambda r: r["index"])
+    return {"results": results}
+
+@router.patch("/batch", response_model=IdeaBatchOut, summary="Update many ideas in one transaction")
+async def update_ideas_batch(payload: IdeaBatchIn, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
+    results: list[dict] = []
+    valid: list[tuple[int, dict]] = []
+    seen: set[UUID] = set()
+    for i, raw in enumerate(payload.items):
+        body = dict(raw)
+        try:
+            iid = UUID(str(body.pop("id")))
+        except (KeyError, ValueError):
+            results.append({"index": i, "status": "invalid", "errors": [{"loc": ["id"], "msg": "A valid idea id is required"}]})
+            continue
+        if iid in seen:
+            results.append({"index": i, "status": "invalid", "id": iid, "errors": [{"loc": ["id"], "msg": "Duplicate id in batch"}]})
+            continue
+        try:
+            data = _apply_ai_defaults(IdeaUpdate.model_validate(body).model_dump(exclude_unset=True))
+        except ValidationError as exc:
+            results.append({"index": i, "status": "invalid", "id": iid, "errors": _validation_errors(exc)})
+            continue
+        seen.add(iid)
+        valid.append((i, {**data, "id": iid}))
+    updated = await update_many(db, [data for _, data in valid], owner_id=current_user.id)
+    for i, data in valid:
+        obj = updated.get(data["id"])
+        if obj is None:
+            results.append({"index": i, "status": "not_found", "id": data["id"]})
+        else:
+            results.append({"index": i, "status": "updated", "id": obj.id, "item": obj})
+    results.sort(key=lambda r: r["index"])
+    return {"results": results}
+
+@router.delete("/batch", response_model=IdeaBatchOut, summary="Delete many ideas in one transaction")
+async def delete_ideas_batch(payload: IdeaBatchDeleteIn, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
+    results: list[dict] = []
+    valid: list[tuple[int, UUID]] = []
+    for i, raw in enumerate(payload.ids):
+        try:
+            valid.append((i, UUID(raw)))
+        except ValueError:
+            results.append({"index": i, "status": "invalid", "errors": [{"loc": ["ids", i], "msg": "Invalid idea id"}]})
+    deleted = await delete_many(db, [iid for _, iid in valid], owner_id=current_user.id)
+    for i, iid in valid:
+        results.append({"index": i, "status": "deleted" if iid in deleted else "not_found", "id": iid})
+    results.sort(key=lambda r: r["index"])
+    return {"results": results}
 
 @router.get("/{idea_id}", response_model=IdeaOut)
-async def get_idea(idea_id: str, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
+async def get_idea(
+    idea_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_verified),
+):
+    if request.headers.get("if-none-match"):
+        # revalidation: compare against updated_at/score before loading the row
+        version = await get_version(db, idea_id, owner_id=current_user.id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Idea not found")
+        etag = make_etag("idea", idea_id, *version, current_user.updated_at)
+        if etag_matches(request, etag):
+            return not_modified(etag)
     obj = await get(db, idea_id, owner_id=current_user.id)
     if not obj:
         raise HTTPException(status_code=404, detail="Idea not found")
     if obj.owner_id != current_user.id:
         raise HTTPException(status_code=404, detail="Idea not found")
-    return obj
+    return json_response(idea_dict(obj), headers=cache_headers(make_etag("idea", idea_id, obj.updated_at, obj.score, current_user.updated_at)))
+
+@router.get("/{idea_id}/similar", response_model=IdeaSimilarOut, summary="Near-duplicates of an idea among your ideas")
+async def similar_ideas(
+    idea_id: str,
+    limit: int = Query(10, ge=1, le=50),
+    min_similarity: float = Query(dedup.DEFAULT_MIN_SIMILARITY, ge=0.1, le=1.0),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_verified),
+):
+    obj = await get(db, idea_id, owner_id=current_user.id)
+    if not obj or obj.owner_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Idea not found")
+    found = await similar(db, obj, owner_id=current_user.id, limit=limit, min_similarity=min_similarity)
+    return {"items": [{"id": iid, "title": title, "similarity": round(sim, 3)} for iid, title, sim in found]}
 
 @router.patch("/{idea_id}", response_model=IdeaOut)
 async def update_idea(idea_id: str, payload: IdeaUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
-    data = payload.model_dump(exclude_unset=True)
-    if "uses_ai" in data and data.get("uses_ai") is False:
-        data["ai_complexity"] = 0
+    data = _apply_ai_defaults(payload.model_dump(exclude_unset=True))
     obj = await update_(db, idea_id, data, owner_id=current_user.id)
     if not obj:
         raise HTTPException(status_code=404, detail="Idea not found")
@@ -82,6 +446,42 @@ async def delete_idea(idea_id: str, db: AsyncSession = Depends(get_db), current_
 async def list_available_tags():
     return {"available": sorted(ALLOWED_TAGS)}
 
+@router.get("/meta/stats", response_model=IdeaStatsOut, summary="Idea count, score and AI aggregates for the current user")
+async def idea_stats_route(db: AsyncSession = Depends(get_db), current_user: User = Depends(require_verified)):
+    stats = await get_stats(db, owner_id=current_user.id)
+    n = stats.idea_count if stats else 0
+    return {
+        "idea_count": n,
+        "ai_count": stats.ai_count if stats else 0,
+        "ai_share": stats.ai_count / n if n else None,
+        "avg_score": stats.score_sum / n if n else None,
+        "max_score": stats.max_score if n else None,
+        "histogram": list(stats.histogram) if stats else [0] * STATS_BUCKETS,
+        "bucket_width": (STATS_SCORE_MAX - STATS_SCORE_MIN) / STATS_BUCKETS,
+        "updated_at": stats.updated_at if stats else None,
+    }
+
+@router.get("/meta/tag-counts", response_model=TagCountsOut, summary="Per-tag idea counts for the current filters")
+async def tag_counts_route(
+    q: str | None = Query(None, description="Full-text search in title/description (web search syntax)"),
+    uses_ai: bool | None = Query(None, description="Filter by AI usage"),
+    min_score: float | None = Query(None, ge=0, le=5, description="Min score (0..5)"),
+    max_score: float | None = Query(None, ge=0, le=5, description="Max score (0..5)"),
+    tags: List[str] | None = Query(None, description="Filter by these tag slugs (see tags_mode)"),
+    tags_mode: TagsMode = Query(TagsMode.any, description="any: at least one of tags; all: every tag"),
+    match: IdeaMatch = Query(IdeaMatch.fts, description="How q matches: full-text or title trigram"),
+    similarity: float = Query(0.3, ge=0.0, le=1.0, description="Trigram match threshold (0..1)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_verified),
+):
+    if (min_score is not None and max_score is not None) and (min_score > max_score):
+        raise HTTPException(status_code=400, detail="min_score cannot be greater than max_score")
+    counts = await tag_counts(
+        db, owner_id=current_user.id, q=q, uses_ai=uses_ai, min_score=min_score, max_score=max_score,
+        match=match.value, similarity=similarity, **_tag_filters(tags, tags_mode),
+    )
+    return {"counts": {t: counts.get(t, 0) for t in sorted(ALLOWED_TAGS)}}
+
 # Add tags (idempotent union)
 @router.post("/{idea_id}/tags", response_model=IdeaOut, summary="Add tags to idea")
 async def add_tags_route(
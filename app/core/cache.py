@@ -0,0 +1,129 @@
+"""In-process caches.
+
+The app runs a single worker (see entrypoint.sh), so a per-process cache is
+shared by every request. Entries are keyed on a per-owner write version
+(:class:`WriteVersions`) where staleness matters: a write bumps the version
+and later reads simply miss, no explicit invalidation needed. The TTL bounds
+how long changes made outside this process (scripts, another replica) can
+go unnoticed.
+"""
+
+from __future__ import annotations
+
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+__all__ = ["TTLCache", "WriteVersions", "register_cache", "cache_stats"]
+
+_MISSING = object()
+
+# Differs per process start, so versions (and anything derived from them,
+# like ETags) never repeat across restarts
+BOOT_ID = secrets.token_hex(4)
+
+# name -> any object with a stats() dict, reported by /health/metrics
+_registry: dict[str, Any] = {}
+
+
+class TTLCache:
+    """LRU cache with a per-entry time-to-live and hit/miss counters.
+
+    With ``max_bytes`` the cache is also bounded by the sizes passed to
+    :meth:`set` (e.g. ``len()`` of serialized bodies).
+    """
+
+    def __init__(self, name: str, *, maxsize: int = 1024, ttl: float = 300.0, max_bytes: int | None = None):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+        register_cache(name, self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING or item[0] < time.monotonic():
+            if item is not _MISSING:
+                self.pop(key)
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: Hashable, value: Any, *, nbytes: int = 0) -> None:
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        self.pop(key)
+        self._data[key] = (time.monotonic() + self.ttl, value, nbytes)
+        self.bytes += nbytes
+        while len(self._data) > self.maxsize or (self.max_bytes is not None and self.bytes > self.max_bytes):
+            _, (_, _, size) = self._data.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.bytes -= item[2]
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data), "maxsize": self.maxsize, "ttl": self.ttl,
+            "bytes": self.bytes, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+class WriteVersions:
+    """Per-key write versions (e.g. per owner), at most ``maxsize`` tracked.
+
+    Bump *after* the write commits: a reader that saw the old version may then
+    only cache old data under the old key.
+
+    Every bump takes the next value of one process-wide counter, so a key's
+    versions only grow. Least recently used keys are dropped past
+    ``maxsize``; untracked keys share a floor version that moves to the
+    current counter on each eviction, so an evicted key never gets back a
+    version it (or an untracked key) was handed before.
+    """
+
+    def __init__(self, maxsize: int = 100_000) -> None:
+        self.maxsize = maxsize
+        self._versions: OrderedDict[Hashable, int] = OrderedDict()
+        self._counter = 0
+        self._floor = 0
+
+    def bump(self, key: Hashable) -> None:
+        self._counter += 1
+        self._versions[key] = self._counter
+        self._versions.move_to_end(key)
+        while len(self._versions) > self.maxsize:
+            self._versions.popitem(last=False)
+            self._floor = self._counter
+
+    def get(self, key: Hashable) -> str:
+        version = self._versions.get(key)
+        if version is None:
+            return f"{BOOT_ID}.f{self._floor}"
+        self._versions.move_to_end(key)
+        return f"{BOOT_ID}.{version}"
+
+
+def register_cache(name: str, cache: Any) -> None:
+    _registry[name] = cache
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _registry.items()}
@@ -20,12 +20,35 @@ class Settings(BaseSettings):
     ENABLE_DOCS: bool = True                # set False in .env.prod to hide /docs
     ALLOWED_HOSTS: str = ""                 # comma list, e.g. "api.eddyb.dev"
 
-    # scoring weights
+    # scoring weights (baked into ideas.score; run app.scripts.rescore after changing)
     SCORE_W_SCALABILITY: float = 0.35
     SCORE_W_EASE: float = 0.25
     SCORE_W_AI_FLAG: float = 0.10
     SCORE_W_AI_COMPLEX: float = 0.30
 
+    # in-process columnar cache of hot owners' ideas for GET /ideas (app.services.idea_cache)
+    IDEA_CACHE_ENABLED: bool = False
+    IDEA_CACHE_MAX_MB: int = 128            # memory budget, LRU-evicted by owner
+    IDEA_CACHE_MAX_ROWS: int = 50_000       # owners with more ideas always query Postgres
+    IDEA_CACHE_TTL_SECONDS: float = 300     # bounds staleness from out-of-process writes
+
+    # serialized GET /ideas responses per (owner, query, write version); 0 MB disables
+    RESPONSE_CACHE_MAX_MB: int = 32
+    RESPONSE_CACHE_TTL_SECONDS: float = 60
+    # GET /ideas ETags change at least this often, so writes outside this
+    # process (app.scripts.rescore, direct SQL) reach clients within it
+    LIST_ETAG_WINDOW_SECONDS: int = 60
+
+    # authenticated users by id (app.services.users.get_user_cached)
+    USER_CACHE_MAX: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 30      # bounds staleness from out-of-process writes
+
+    # POST /ideas/import body limit (parsed and spooled before any DB work)
+    IMPORT_MAX_MB: int = 50
+
+    # verified access tokens -> sub until exp (app.core.security.decode_access_token); 0 disables
+    JWT_CACHE_MAX: int = 10_000
+
     # CORS - Store as string and convert to list
     BACKEND_CORS_ORIGINS: str = ""
 
@@ -1,8 +1,15 @@
 # app/core/logging.py
+import atexit
+import copy
 import logging
 import logging.config
 import os
+import queue
+import random
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+import orjson
 
 # Optional but recommended on Windows for ANSI colors:
 try:
@@ -12,6 +19,19 @@ except Exception:
     pass
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# Records waiting for the writer thread; beyond this they are dropped (and counted)
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+# "text" (colored / plain lines) or "json" (one object per line)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+# Share of successful (< 400) access lines kept; errors and slow requests are always logged
+ACCESS_LOG_SAMPLE_RATE = float(os.getenv("ACCESS_LOG_SAMPLE_RATE", "1.0"))
+ACCESS_LOG_SLOW_MS = int(os.getenv("ACCESS_LOG_SLOW_MS", "1000"))
+
+ACCESS_LOGGER = "app.request"
+# extra fields the request middleware puts on app.request records
+ACCESS_FIELDS = ("request_id", "method", "path", "status_code", "duration_ms", "client")
+_ACCESS_KEYS = frozenset(ACCESS_FIELDS)
 
 # --- ANSI colors (keep it simple) ---
 RESET = "\x1b[0m"
@@ -69,6 +89,27 @@ class NiceFormatter(logging.Formatter):
         return formatted
 
 
+# (second, "%Y-%m-%d %H:%M:%S") of the last access line; records are formatted
+# on the single writer thread, so strftime runs about once per second
+_asctime_cache: tuple[int, str] = (-1, "")
+
+
+def _asctime(record: logging.LogRecord) -> str:
+    global _asctime_cache
+    second = int(record.created)
+    if _asctime_cache[0] != second:
+        _asctime_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _asctime_cache[1]
+
+
+def _with_traceback(formatter: logging.Formatter, record: logging.LogRecord, formatted: str) -> str:
+    if record.exc_info:
+        return f"{formatted}\n{formatter.formatException(record.exc_info)}"
+    if record.exc_text:
+        return f"{formatted}\n{record.exc_text}"
+    return formatted
+
+
 class AccessFormatter(NiceFormatter):
     """
     Formatter for app.request lines.
@@ -76,48 +117,146 @@ class AccessFormatter(NiceFormatter):
     We rely on the middleware to pass status_code, method, path, duration_ms, client in record.extra.
     """
     def format(self, record: logging.LogRecord) -> str:
-        # Build base line first (time | LEVEL | logger | message)
+        d = record.__dict__
+        if not _ACCESS_KEYS <= d.keys():
+            return super().format(record)  # plain message (+ traceback)
         if not hasattr(record, "asctime"):
-            record.asctime = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
+            record.asctime = _asctime(record)
+        formatted = (
+            f"{WHITE}{record.asctime}{RESET} | {COLORS.get(record.levelname, WHITE)}{record.levelname:<8}{RESET} | "
+            f"{WHITE}{record.name}{RESET} | "
+            f"{WHITE}rid={d['request_id']} method={d['method']} path={d['path']} "
+            f"status={status_color(int(d['status_code']))}{d['status_code']}{RESET} "
+            f"duration_ms={d['duration_ms']} client={d['client']}{RESET}"
+        )
+        return _with_traceback(self, record, formatted)
 
-        levelname = record.levelname
-        level_col = COLORS.get(levelname, WHITE)
 
-        # Pull structured fields (all optional)
-        method = getattr(record, "method", None)
-        path = getattr(record, "path", None)
-        status_code = getattr(record, "status_code", None)
-        duration_ms = getattr(record, "duration_ms", None)
-        client = getattr(record, "client", None)
-        rid = getattr(record, "request_id", "-")
-
-        if all(v is not None for v in (method, path, status_code, duration_ms, client)):
-            # status gets color; everything else white
-            sc_col = status_color(int(status_code))
-            msg = (
-                f"{WHITE}rid={rid} method={method} path={path} "
-                f"status={sc_col}{status_code}{RESET} "
-                f"duration_ms={duration_ms} client={client}{RESET}"
-            )
-        else:
-            # Fallback to plain message if fields missing
-            msg = f"{WHITE}{record.getMessage()}{RESET}"
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line (LOG_FORMAT=json).
 
-        parts = [
-            f"{WHITE}{record.asctime}{RESET}",
-            f"{level_col}{levelname:<8}{RESET}",
-            f"{WHITE}{record.name}{RESET}",
-            msg,
-        ]
-        formatted = " | ".join(parts)
-        
-        # Add traceback if exception info is present
+    Always ts/level/logger/msg; app.request records add the access fields,
+    other records any ``extra`` listed in ``fields``.
+    """
+    def __init__(self, fields: tuple[str, ...] = ACCESS_FIELDS):
+        super().__init__()
+        self.fields = fields
+        self._second = -1
+        self._stamp = ""
+
+    def _timestamp(self, created: float, msecs: float) -> str:
+        second = int(created)
+        if second != self._second:  # strftime once per second
+            self._second = second
+            self._stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._stamp}.{int(msecs):03d}Z"
+
+    def format(self, record: logging.LogRecord) -> str:
+        d = record.__dict__
+        out = {
+            "ts": self._timestamp(record.created, record.msecs),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for name in self.fields:
+            if name in d:
+                out[name] = d[name]
         if record.exc_info:
-            formatted += "\n" + self.formatException(record.exc_info)
+            out["exc"] = self.formatException(record.exc_info)
         elif record.exc_text:
-            formatted += "\n" + record.exc_text
-            
-        return formatted
+            out["exc"] = record.exc_text
+        return orjson.dumps(out, default=str).decode()
+
+
+def keep_access_line(status_code: int, duration_ms: int) -> bool:
+    """Access-log sampling: every error and slow request, ACCESS_LOG_SAMPLE_RATE of the rest."""
+    return (
+        ACCESS_LOG_SAMPLE_RATE >= 1.0
+        or status_code >= 400
+        or duration_ms >= ACCESS_LOG_SLOW_MS
+        or random.random() < ACCESS_LOG_SAMPLE_RATE
+    )
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler over a bounded queue that drops (and counts) instead of blocking.
+
+    Only the message is resolved on the caller's thread; formatting,
+    tracebacks included, happens on the listener thread.
+    """
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _Listener(QueueListener):
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # blocks until the writer makes room; never dropped
+
+
+# Set while the writer thread runs (see configure_logging / shutdown_logging)
+_listener: _Listener | None = None
+_queue_handler: DroppingQueueHandler | None = None
+_queued_loggers: list[str | None] = []
+
+
+def _start_queue(names: list[str | None]) -> None:
+    """Move the stdout handlers of ``names`` behind one bounded queue + writer thread."""
+    global _listener, _queue_handler, _queued_loggers
+    default_handler = logging.getLogger().handlers[0]
+    access_handler = logging.getLogger(ACCESS_LOGGER).handlers[0]
+    # one writer for every logger, so route access lines by logger name
+    default_handler.addFilter(lambda record: record.name != ACCESS_LOGGER)
+    access_handler.addFilter(lambda record: record.name == ACCESS_LOGGER)
+
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    _queue_handler = DroppingQueueHandler(log_queue)
+    _listener = _Listener(log_queue, default_handler, access_handler, respect_handler_level=True)
+    _queued_loggers = names
+    for name in names:
+        logging.getLogger(name).handlers = [_queue_handler]
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and write synchronously from now on (app shutdown)."""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()  # drains the queue, then joins the writer thread
+    for name in _queued_loggers:
+        logging.getLogger(name).handlers = list(listener.handlers)
+    if _queue_handler is not None and _queue_handler.dropped:
+        logging.getLogger("app").warning(f"Log queue overflowed; dropped {_queue_handler.dropped} records")
+
+
+atexit.register(shutdown_logging)
+
+
+def log_queue_stats() -> dict:
+    """Queue depth and overflow drops, reported by /health/metrics."""
+    if _queue_handler is None:
+        return {"enabled": False}
+    return {
+        "enabled": _listener is not None,
+        "queued": _queue_handler.queue.qsize(),
+        "maxsize": LOG_QUEUE_SIZE,
+        "dropped": _queue_handler.dropped,
+    }
 
 
 def configure_logging() -> None:
@@ -126,7 +265,11 @@ def configure_logging() -> None:
     - root/app/uvicorn use NiceFormatter
     - app.request uses AccessFormatter
     - uvicorn.access is silenced (we have our own)
+    - LOG_FORMAT=json switches every handler to JsonFormatter
+    - handlers sit behind a bounded queue; a background thread formats and
+      writes to stdout (call shutdown_logging() on exit to flush)
     """
+    shutdown_logging()  # reconfiguring: flush and stop a previous writer first
     # Force custom formatters in Docker (check for container environment)
     use_color = sys.stdout.isatty() or os.getenv("FORCE_COLOR_LOGS", "false").lower() == "true"
     
@@ -167,30 +310,38 @@ def configure_logging() -> None:
             "format": "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
+        "json": {
+            "()": JsonFormatter,
+        },
     }
+    if LOG_FORMAT == "json":
+        for handler in handlers.values():
+            handler["formatter"] = "json"
+
+    loggers = {
+        # Our app loggers
+        "app": {"level": LOG_LEVEL, "handlers": ["stdout_default"], "propagate": False},
+        "app.request": {"level": LOG_LEVEL, "handlers": ["stdout_access"], "propagate": False},
+
+        # Uvicorn
+        "uvicorn": {"level": LOG_LEVEL, "handlers": ["stdout_default"], "propagate": False},
+        "uvicorn.error": {"level": LOG_LEVEL, "handlers": ["stdout_default"], "propagate": False},
+
+        # Silence uvicorn.access (we log access ourselves)
+        "uvicorn.access": {"level": "CRITICAL", "handlers": ["stdout_default"], "propagate": False},
 
+        # SQLAlchemy (quiet by default; flip to INFO when needed)
+        "sqlalchemy.engine": {"level": "WARNING", "handlers": ["stdout_default"], "propagate": False},
+    }
     logging.config.dictConfig({
         "version": 1,
         "disable_existing_loggers": False,
         "formatters": formatters,
         "handlers": handlers,
         "root": {"level": LOG_LEVEL, "handlers": ["stdout_default"]},
-        "loggers": {
-            # Our app loggers
-            "app": {"level": LOG_LEVEL, "handlers": ["stdout_default"], "propagate": False},
-            "app.request": {"level": LOG_LEVEL, "handlers": ["stdout_access"], "propagate": False},
-
-            # Uvicorn
-            "uvicorn": {"level": LOG_LEVEL, "handlers": ["stdout_default"], "propagate": False},
-            "uvicorn.error": {"level": LOG_LEVEL, "handlers": ["stdout_default"], "propagate": False},
-
-            # Silence uvicorn.access (we log access ourselves)
-            "uvicorn.access": {"level": "CRITICAL", "handlers": ["stdout_default"], "propagate": False},
-
-            # SQLAlchemy (quiet by default; flip to INFO when needed)
-            "sqlalchemy.engine": {"level": "WARNING", "handlers": ["stdout_default"], "propagate": False},
-        },
+        "loggers": loggers,
     })
+    _start_queue(names=[None, *loggers])
 
 
 class PlainNiceFormatter(logging.Formatter):
@@ -215,35 +366,17 @@ class PlainNiceFormatter(logging.Formatter):
         return formatted
 
 
-class PlainAccessFormatter(logging.Formatter):
+class PlainAccessFormatter(PlainNiceFormatter):
     """Plain version of AccessFormatter without colors for Docker"""
     def format(self, record: logging.LogRecord) -> str:
+        d = record.__dict__
+        if not _ACCESS_KEYS <= d.keys():
+            return super().format(record)  # plain message (+ traceback)
         if not hasattr(record, "asctime"):
-            record.asctime = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
-
-        method = getattr(record, "method", None)
-        path = getattr(record, "path", None)
-        status_code = getattr(record, "status_code", None)
-        duration_ms = getattr(record, "duration_ms", None)
-        client = getattr(record, "client", None)
-        rid = getattr(record, "request_id", "-")
-
-        if all(v is not None for v in (method, path, status_code, duration_ms, client)):
-            msg = f"rid={rid} method={method} path={path} status={status_code} duration_ms={duration_ms} client={client}"
-        else:
-            msg = record.getMessage()
-
-        parts = [
-            record.asctime,
-            f"{record.levelname:<8}",
-            record.name,
-            msg,
-        ]
-        formatted = " | ".join(parts)
-        
-        if record.exc_info:
-            formatted += "\n" + self.formatException(record.exc_info)
-        elif record.exc_text:
-            formatted += "\n" + record.exc_text
-            
-        return formatted
+            record.asctime = _asctime(record)
+        formatted = (
+            f"{record.asctime} | {record.levelname:<8} | {record.name} | "
+            f"rid={d['request_id']} method={d['method']} path={d['path']} status={d['status_code']} "
+            f"duration_ms={d['duration_ms']} client={d['client']}"
+        )
+        return _with_traceback(self, record, formatted)
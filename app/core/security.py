@@ -1,7 +1,13 @@
+import hashlib
+import hmac
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.cache import register_cache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -17,3 +23,79 @@ def create_access_token(subject: str, expires_minutes: int | None = None) -> str
     )
     to_encode = {"sub": subject, "exp": expire}
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ACCESS_TOKEN_ALGORITHM)
+
+
+class TokenClaimCache:
+    """LRU of verified access tokens -> ``(sub, exp)``, so a token presented
+    again skips the signature check and claim parsing until it expires.
+
+    Entries are found by the first half of an HMAC-SHA256 of the raw token
+    under a random per-process key and confirmed with ``compare_digest`` on
+    the full digest. Attackers can neither choose nor observe the digests, so
+    lookup time says nothing about which tokens are cached, and nothing
+    stored here is usable as a token.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._key = secrets.token_bytes(32)
+        self._data: OrderedDict[bytes, tuple[bytes, str, float]] = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def _digest(self, token: str) -> bytes:
+        return hmac.new(self._key, token.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, token: str) -> str | None:
+        """Cached ``sub`` of a still-valid token, else None."""
+        digest = self._digest(token)
+        entry = self._data.get(digest[:16])
+        if entry is None or not hmac.compare_digest(entry[0], digest):
+            self.misses += 1
+            return None
+        if entry[2] <= time.time():
+            del self._data[digest[:16]]
+            self.misses += 1
+            return None
+        self._data.move_to_end(digest[:16])
+        self.hits += 1
+        return entry[1]
+
+    def set(self, token: str, sub: str, exp: float) -> None:
+        digest = self._digest(token)
+        self._data[digest[:16]] = (digest, sub, exp)
+        self._data.move_to_end(digest[:16])
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data), "maxsize": self.maxsize,
+            "hits": self.hits, "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+token_claims = TokenClaimCache(settings.JWT_CACHE_MAX)
+register_cache("jwt_claims", token_claims)
+
+def decode_access_token(token: str) -> str | None:
+    """Verified ``sub`` claim of an access token (None if absent).
+
+    Raises JWTError for a bad signature or an expired / malformed token.
+    Tokens with ``sub`` and a numeric ``exp`` are cached until they expire.
+    """
+    if settings.JWT_CACHE_MAX > 0:
+        sub = token_claims.get(token)
+        if sub is not None:
+            return sub
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ACCESS_TOKEN_ALGORITHM])
+    sub, exp = payload.get("sub"), payload.get("exp")
+    if settings.JWT_CACHE_MAX > 0 and isinstance(sub, str) and isinstance(exp, (int, float)):
+        token_claims.set(token, sub, float(exp))
+    return sub
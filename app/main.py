@@ -8,8 +8,8 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from app.core.logging import configure_logging
-from app.api.middleware import RequestIDMiddleware, AccessLogMiddleware, request_id_ctx
+from app.core.logging import configure_logging, shutdown_logging
+from app.api.middleware import RequestContextMiddleware, request_id_ctx
 from slowapi.errors import RateLimitExceeded
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.middleware import SlowAPIMiddleware
@@ -17,6 +17,8 @@ from app.core.rate_limit import limiter
 
 from app import __version__ as API_VERSION
 from app.core.config import settings
+from app.db.session import SessionLocal
+from app.services.ideas import tag_registry_drift
 
 start_time = datetime.now(timezone.utc)
 
@@ -44,7 +46,17 @@ def create_app() -> FastAPI:
         logger.info("📋 API Documentation: http://localhost:8000/docs")
         logger.info("🔧 Interactive API: http://localhost:8000/redoc")
         logger.info("💡 Main API: http://localhost:8000")
+        # tag filters are bitwise: code and DB must agree on every slug's bit
+        try:
+            async with SessionLocal() as db:
+                drift = await tag_registry_drift(db)
+            if drift:
+                logger.error(f"Tag registry out of sync with the database (missing migration?): {drift}")
+        except Exception as exc:
+            logger.warning(f"Tag registry check skipped: {exc}")
         yield
+        logger.info("Idea Manager API is shutting down")
+        shutdown_logging()  # flush the log queue; later records are written directly
 
     app = FastAPI(
         title="Idea Manager",
@@ -79,21 +91,9 @@ def create_app() -> FastAPI:
     )
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=hosts)
 
-    # Minimal security headers in prod (safe behind Cloudflare)
-    if settings.APP_ENV != "dev":
-        @app.middleware("http")
-        async def _security_headers(request, call_next):
-            resp = await call_next(request)
-            resp.headers.setdefault("X-Frame-Options", "DENY")
-            resp.headers.setdefault("X-Content-Type-Options", "nosniff")
-            resp.headers.setdefault("Referrer-Policy", "no-referrer")
-            # HSTS is fine through Cloudflare (clients see it)
-            resp.headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload")
-            return resp
-
-    # Add middleware
-    app.add_middleware(RequestIDMiddleware)
-    app.add_middleware(AccessLogMiddleware)
+    # Request ID, access log and (in prod) minimal security headers; added last
+    # so it wraps everything above
+    app.add_middleware(RequestContextMiddleware, security_headers=settings.APP_ENV != "dev")
 
     # Handle unexpected errors
     app.add_exception_handler(Exception, unhandled_exception_handler)
@@ -2,21 +2,46 @@ import sqlalchemy as sa
 from sqlalchemy import orm
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
-from sqlalchemy.ext.hybrid import hybrid_property
 import uuid
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from app.db.base import Base
 from app.core.config import settings
 
 
-def _norm15(col):  # maps 1..5 -> 0..1
-    return (sa.cast(col, sa.Float) - 1.0) / 4.0
+# SQL scoring function used by the ``trg_ideas_set_score`` trigger; weights are
+# baked in from Settings, so re-run app.scripts.rescore after changing SCORE_W_*.
+SCORE_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION idea_score(scalability integer, ease_to_build integer, uses_ai boolean, ai_complexity integer)
+RETURNS double precision
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT (
+        {w_scalability} * ((scalability - 1) / 4.0)
+        + {w_ease} * ((ease_to_build - 1) / 4.0)
+        + {w_ai_flag} * (CASE WHEN uses_ai THEN 1.0 ELSE 0.0 END)
+        + {w_ai_complex} * (ai_complexity / 5.0)
+    )::double precision * 5.0
+$$;
+"""
 
-def _norm05(col):  # maps 0..5 -> 0..1
-    return sa.cast(col, sa.Float) / 5.0
+# Full-text search: title weighs more (A) than description (B)
+FTS_CONFIG = "english"
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{FTS_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{FTS_CONFIG}', coalesce(description, '')), 'B')"
+)
+
+# List views show a short preview; stored so they never detoast the full Text
+DESCRIPTION_PREVIEW_CHARS = 280
+
+def score_function_sql() -> str:
+    w = settings
+    return SCORE_FUNCTION_SQL.format(
+        w_scalability=float(w.SCORE_W_SCALABILITY),
+        w_ease=float(w.SCORE_W_EASE),
+        w_ai_flag=float(w.SCORE_W_AI_FLAG),
+        w_ai_complex=float(w.SCORE_W_AI_COMPLEX),
+    )
 
-def _ai_flag(col):
-    return sa.case((col.is_(True), 1.0), else_=0.0)
 
 class Idea(Base):
     __tablename__ = "ideas"
@@ -24,6 +49,9 @@ class Idea(Base):
     id = sa.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = sa.Column(sa.String(200), nullable=False)
     description = sa.Column(sa.Text, nullable=False)
+    description_preview = orm.deferred(
+        sa.Column(sa.String(DESCRIPTION_PREVIEW_CHARS), sa.Computed(f"left(description, {DESCRIPTION_PREVIEW_CHARS})", persisted=True))
+    )
 
     scalability = sa.Column(sa.Integer, nullable=False) # 1-5 scale
     ease_to_build = sa.Column(sa.Integer, nullable=False, default=1) # 1-5 scale
@@ -35,33 +63,38 @@ class Idea(Base):
     updated_at = sa.Column(sa.DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # ownership
-    owner_id = sa.Column(UUID(as_uuid=True), sa.ForeignKey("users.id"), nullable=True, index=True)
-    owner = orm.relationship("User", backref="ideas")
-
-    # ---------------- score (computed) ----------------
-    @hybrid_property
-    def score(self) -> float:
-        w = settings
-        def norm15(v): return (v - 1.0) / 4.0
-        def norm05(v): return v / 5.0
-        base = (
-            w.SCORE_W_SCALABILITY * norm15(self.scalability)
-            + w.SCORE_W_EASE * norm15(self.ease_to_build)
-            + w.SCORE_W_AI_FLAG * (1.0 if self.uses_ai else 0.0)
-            + w.SCORE_W_AI_COMPLEX * norm05(self.ai_complexity)
-        )
-        return base * 5.0  # final score 0..5
-
-    @score.expression
-    def score(cls):
-        w = settings
-        base = (
-            w.SCORE_W_SCALABILITY * _norm15(cls.scalability)
-            + w.SCORE_W_EASE * _norm15(cls.ease_to_build)
-            + w.SCORE_W_AI_FLAG * _ai_flag(cls.uses_ai)
-            + w.SCORE_W_AI_COMPLEX * _norm05(cls.ai_complexity)
-        )
-        return base * 5.0
-    
-# Fast overlap queries (tags && array)
-sa.Index("ix_ideas_tags_gin", Idea.tags, postgresql_using="gin")
+    owner_id = sa.Column(UUID(as_uuid=True), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    owner = orm.relationship("User", backref=orm.backref("ideas", passive_deletes=True))
+
+    # ---------------- score (persisted) ----------------
+    # Maintained by the trg_ideas_set_score trigger (see SCORE_FUNCTION_SQL); the
+    # value is read back via RETURNING on insert/update (eager_defaults).
+    score = sa.Column(sa.Float, nullable=False, server_default=sa.text("0"), server_onupdate=sa.FetchedValue())
+
+    # ---------------- tag bitmask ----------------
+    # One bit per tag_registry entry, maintained from tags by the
+    # trg_ideas_set_tag_mask trigger; tag filters and facets use bitwise ops.
+    tag_mask = sa.Column(sa.Integer, nullable=False, server_default=sa.text("0"), server_onupdate=sa.FetchedValue())
+
+    # ---------------- near-duplicate detection ----------------
+    # MinHash signature of title + description (app.services.dedup); NULL until
+    # computed (bulk imports are filled in by app.scripts.backfill_minhash).
+    minhash = orm.deferred(sa.Column(sa.LargeBinary, nullable=True))
+
+    # ---------------- full-text search (generated) ----------------
+    # Deferred: only used in WHERE/ORDER BY, never worth shipping to Python.
+    search_vector = orm.deferred(sa.Column(TSVECTOR, sa.Computed(SEARCH_VECTOR_SQL, persisted=True)))
+
+    __mapper_args__ = {"eager_defaults": True}
+
+# Full-text search (search_vector @@ websearch_to_tsquery(...))
+sa.Index("ix_ideas_search_vector_gin", Idea.search_vector, postgresql_using="gin")
+
+# Substring / fuzzy title search (pg_trgm)
+sa.Index("ix_ideas_title_trgm", Idea.title, postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"})
+
+# Keyset pagination: (owner_id, created_at, id) serves both sort directions
+sa.Index("ix_ideas_owner_created_at_id", Idea.owner_id, Idea.created_at, Idea.id)
+
+# Keyset pagination / score filters: (owner_id, score DESC, id DESC)
+sa.Index("ix_ideas_owner_score_id", Idea.owner_id, Idea.score.desc(), Idea.id.desc())
@@ -0,0 +1,16 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base import Base
+
+class IdeaLshBucket(Base):
+    """LSH band buckets of ideas.minhash (see app.services.dedup).
+
+    Ideas sharing any (owner_id, band, bucket) are near-duplicate candidates;
+    the primary key is the lookup index.
+    """
+    __tablename__ = "idea_lsh_buckets"
+
+    owner_id = sa.Column(UUID(as_uuid=True), primary_key=True)
+    band = sa.Column(sa.SmallInteger, primary_key=True)
+    bucket = sa.Column(sa.BigInteger, primary_key=True)
+    idea_id = sa.Column(UUID(as_uuid=True), sa.ForeignKey("ideas.id", ondelete="CASCADE"), primary_key=True, index=True)
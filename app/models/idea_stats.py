@@ -0,0 +1,30 @@
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.sql import func
+from app.db.base import Base
+
+# Score histogram: STATS_BUCKETS equal-width buckets over [0, 5]
+STATS_BUCKETS = 10
+STATS_SCORE_MIN = 0.0
+STATS_SCORE_MAX = 5.0
+
+# Bucket index (1..STATS_BUCKETS) for a score column; out-of-range scores clamp to the ends
+STATS_BUCKET_SQL = (
+    f"least(greatest(width_bucket({{score}}, {STATS_SCORE_MIN}, {STATS_SCORE_MAX}, {STATS_BUCKETS}), 1), {STATS_BUCKETS})"
+)
+
+
+class IdeaStats(Base):
+    """Per-owner aggregates over ideas, kept current by statement-level triggers
+    on ideas (trg_ideas_stats_*). Rebuild with ``python -m app.scripts.rebuild_idea_stats``.
+    """
+    __tablename__ = "idea_stats"
+
+    # No FK: rows may briefly outlive a deleted user (its ideas' owner_id goes NULL)
+    owner_id = sa.Column(UUID(as_uuid=True), primary_key=True)
+    idea_count = sa.Column(sa.Integer, nullable=False, server_default=sa.text("0"))
+    ai_count = sa.Column(sa.Integer, nullable=False, server_default=sa.text("0"))
+    score_sum = sa.Column(sa.Float, nullable=False, server_default=sa.text("0"))
+    max_score = sa.Column(sa.Float, nullable=True)
+    histogram = sa.Column(ARRAY(sa.Integer), nullable=False)
+    updated_at = sa.Column(sa.DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,39 @@
+import sqlalchemy as sa
+from typing import Iterable
+from app.db.base import Base
+
+# Versioned tag registry: each allowed slug owns one bit of ideas.tag_mask.
+# Append-only - a slug's bit is its position here and is never reused or
+# reordered. To add a tag, append it with TAG_REGISTRY_VERSION + 1 and ship a
+# migration inserting the same (slug, bit, version) row into tag_registry.
+TAG_REGISTRY: tuple[tuple[str, int], ...] = (  # (slug, registry version that added it)
+    ("web", 1), ("mobile", 1), ("ai", 1), ("ml", 1), ("iot", 1),
+    ("blockchain", 1), ("arvr", 1), ("health", 1), ("education", 1), ("finance", 1),
+    ("entertainment", 1), ("social", 1), ("ecommerce", 1), ("productivity", 1), ("gaming", 1),
+)
+TAG_REGISTRY_VERSION = max(version for _, version in TAG_REGISTRY)
+TAG_BITS: dict[str, int] = {slug: bit for bit, (slug, _) in enumerate(TAG_REGISTRY)}
+
+# tag_mask is a signed int4: bits 0..30
+MAX_TAG_BITS = 31
+assert len(TAG_REGISTRY) <= MAX_TAG_BITS, "tag_mask is full; widen it to bigint first"
+
+
+def tag_mask(slugs: Iterable[str]) -> int:
+    """Bitmask for ``slugs``; unknown slugs contribute nothing."""
+    mask = 0
+    for slug in slugs:
+        bit = TAG_BITS.get(slug)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask
+
+
+class TagRegistry(Base):
+    __tablename__ = "tag_registry"
+
+    slug = sa.Column(sa.String(30), primary_key=True)
+    bit = sa.Column(sa.SmallInteger, nullable=False, unique=True)
+    version = sa.Column(sa.Integer, nullable=False)
+
+    __table_args__ = (sa.CheckConstraint(f"bit >= 0 AND bit < {MAX_TAG_BITS}", name="ck_tag_registry_bit_range"),)
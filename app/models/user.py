@@ -16,4 +16,8 @@ class User(Base):
     is_verified = sa.Column(sa.Boolean, nullable=False, server_default=sa.text("false"))
 
     created_at = sa.Column(sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False)
-    updated_at = sa.Column(sa.DateTime(timezone=True), server_default=sa.text("now()"), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at = sa.Column(sa.DateTime(timezone=True), server_default=sa.text("now()"), onupdate=func.now(), nullable=False)
+
+# Substring / fuzzy admin search (pg_trgm)
+sa.Index("ix_users_email_trgm", User.email, postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"})
+sa.Index("ix_users_full_name_trgm", User.full_name, postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"})
@@ -1,14 +1,13 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import List
+from typing import Any, List
 from uuid import UUID
 from datetime import datetime
 from app.schemas.user import UserPublic
+from app.models.tag import TAG_BITS
 
 
-ALLOWED_TAGS = {
-    "web","mobile","ai","ml","iot","blockchain","arvr","health","education",
-    "finance","entertainment","social","ecommerce","productivity","gaming"
-}
+# Allowed slugs come from the tag registry (one tag_mask bit each)
+ALLOWED_TAGS = set(TAG_BITS)
 
 class IdeaBase(BaseModel):
     title: str = Field(min_length=1, max_length=200)
@@ -55,18 +54,124 @@ class IdeaOut(BaseModel):
     created_at: datetime
     updated_at: datetime
     owner: UserPublic | None = None
+    # only with ?q=...&highlight=true
+    snippet: str | None = Field(
+        default=None,
+        description="HTML: description fragments with matches wrapped in <mark>; the description text is HTML-escaped",
+    )
 
     class Config:
         from_attributes = True
 
+# Columns selectable with GET /ideas?fields=... (id is always included)
+IDEA_LIST_FIELDS = (
+    "id", "title", "description", "description_preview", "scalability", "ease_to_build",
+    "uses_ai", "ai_complexity", "tags", "score", "created_at", "updated_at",
+)
+
 class MessageResponse(BaseModel):
     message: str
 
 class IdeasPage(BaseModel):
     items: list[IdeaOut]
-    total: int
+    total: int | None  # None with ?count=none; approximate with ?count=estimate
     limit: int
     offset: int
+    next_cursor: str | None = None  # pass back as ?cursor= for the next page
+    has_more: bool = False
+
+class IdeasCompactPage(BaseModel):
+    """GET /ideas with ?fields= and/or ?compact=true.
+
+    Items carry only the requested fields; with compact the shared owner is
+    sent once here instead of inside every item.
+    """
+    items: list[dict[str, Any]]
+    owner: UserPublic | None = None
+    total: int | None
+    limit: int
+    offset: int
+    next_cursor: str | None = None
+    has_more: bool = False
+
+# Max items per /ideas/batch request
+IDEA_BATCH_MAX = 500
+
+class IdeaBatchIn(BaseModel):
+    # Items are validated one by one (IdeaCreate / IdeaUpdate + "id") so a bad
+    # item is reported in its own result instead of failing the whole batch.
+    items: list[dict[str, Any]] = Field(min_length=1, max_length=IDEA_BATCH_MAX)
+
+class IdeaBatchDeleteIn(BaseModel):
+    ids: list[str] = Field(min_length=1, max_length=IDEA_BATCH_MAX)
+
+class IdeaBatchItemOut(BaseModel):
+    index: int
+    status: str  # created | updated | deleted | not_found | invalid
+    id: UUID | None = None
+    item: IdeaOut | None = None
+    errors: list[dict[str, Any]] | None = None
+
+class IdeaBatchOut(BaseModel):
+    results: list[IdeaBatchItemOut]
+
+class IdeaImportRowError(BaseModel):
+    line: int  # 1-based line in the uploaded file where the record starts
+    errors: list[dict[str, Any]]
+
+class IdeaImportOut(BaseModel):
+    received: int  # data records read (excluding a CSV header)
+    imported: int
+    failed: int
+    errors: list[IdeaImportRowError]  # first IDEA_IMPORT_MAX_ERRORS failures
+    errors_truncated: bool = False
+    elapsed_ms: int
+    rows_per_sec: float
+
+# Per-row errors listed in an import response (the rest are only counted)
+IDEA_IMPORT_MAX_ERRORS = 1000
 
 class TagsOut(BaseModel):
-    available: List[str]
\ No newline at end of file
+    available: List[str]
+
+class IdeaDuplicateOut(BaseModel):
+    id: UUID
+    title: str
+    similarity: float  # estimated Jaccard similarity of title + description shingles, 0..1
+
+class IdeaCreatedOut(IdeaOut):
+    possible_duplicates: list[IdeaDuplicateOut] | None = None  # only with ?check_duplicates=true
+
+class IdeaSimilarOut(BaseModel):
+    items: list[IdeaDuplicateOut]
+
+class IdeaRankIn(BaseModel):
+    """What-if weights; omitted ones use the current SCORE_W_* setting."""
+    scalability: float | None = Field(default=None, ge=-10, le=10)
+    ease: float | None = Field(default=None, ge=-10, le=10)
+    ai_flag: float | None = Field(default=None, ge=-10, le=10)
+    ai_complex: float | None = Field(default=None, ge=-10, le=10)
+    k: int = Field(default=10, ge=1, le=100)
+    uses_ai: bool | None = None
+
+class IdeaRankedOut(IdeaOut):
+    rank: int  # 1 = best under the what-if weights
+    what_if_score: float
+
+class IdeaRankOut(BaseModel):
+    weights: dict[str, float]
+    considered: int  # ideas scored
+    items: list[IdeaRankedOut]
+
+class IdeaStatsOut(BaseModel):
+    idea_count: int
+    ai_count: int
+    ai_share: float | None  # ai_count / idea_count; None without ideas
+    avg_score: float | None
+    max_score: float | None
+    histogram: list[int]  # idea counts per equal-width score bucket, low to high
+    bucket_width: float
+    updated_at: datetime | None
+
+class TagCountsOut(BaseModel):
+    counts: dict[str, int]  # every allowed tag, 0 when no matching idea has it
\ No newline at end of file
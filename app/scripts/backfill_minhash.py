@@ -0,0 +1,18 @@
+import asyncio
+import sys
+from app.db.session import SessionLocal
+from app.services.dedup import backfill
+
+# Index ideas for duplicate detection (after the minhash migration or a bulk import):
+#   docker compose exec app python -m app.scripts.backfill_minhash [--all] [batch_size]
+
+async def main():
+    args = [a for a in sys.argv[1:] if a != "--all"]
+    batch_size = int(args[0]) if args else 1000
+    async with SessionLocal() as db:
+        done = await backfill(db, batch_size=batch_size, all_ideas="--all" in sys.argv[1:])
+        print(f"Indexed ideas for duplicate detection: {done}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from fastapi import FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from app.api.middleware import RequestContextMiddleware, request_id_ctx, access_log
+
+# Requests/sec through the request-context middleware on a trivial route, the
+# previous BaseHTTPMiddleware stack vs the pure-ASGI one. Drives the ASGI app
+# directly (no server, no sockets) so only the app + middleware cost is timed;
+# access lines go to a NullHandler.
+#   docker compose exec app python -m app.scripts.bench_middleware [requests]
+
+
+# ---- previous stack, kept here as the baseline ----
+class _LegacyRequestID(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        rid = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+        token = request_id_ctx.set(rid)
+        try:
+            response = await call_next(request)
+        finally:
+            request_id_ctx.reset(token)
+        response.headers["X-Request-ID"] = rid
+        return response
+
+class _LegacyAccessLog(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        start = time.perf_counter()
+        response = await call_next(request)
+        access_log.info("request", extra={
+            "request_id": response.headers.get("X-Request-ID") or request_id_ctx.get(),
+            "method": request.method, "path": request.url.path, "status_code": response.status_code,
+            "duration_ms": int((time.perf_counter() - start) * 1000),
+            "client": request.client.host if request.client else "-",
+        })
+        return response
+
+async def _legacy_security_headers(request, call_next):
+    resp = await call_next(request)
+    resp.headers.setdefault("X-Frame-Options", "DENY")
+    resp.headers.setdefault("X-Content-Type-Options", "nosniff")
+    resp.headers.setdefault("Referrer-Policy", "no-referrer")
+    resp.headers.setdefault("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload")
+    return resp
+
+
+def _app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    if legacy:
+        app.middleware("http")(_legacy_security_headers)
+        app.add_middleware(_LegacyRequestID)
+        app.add_middleware(_LegacyAccessLog)
+    else:
+        app.add_middleware(RequestContextMiddleware, security_headers=True)
+    return app
+
+
+_SCOPE = {
+    "type": "http", "asgi": {"version": "3.0", "spec_version": "2.4"}, "http_version": "1.1",
+    "method": "GET", "scheme": "http", "path": "/ping", "raw_path": b"/ping", "root_path": "",
+    "query_string": b"", "headers": [(b"host", b"bench"), (b"x-request-id", b"bench-rid")],
+    "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+}
+
+async def _request(app) -> tuple[int, dict[str, str]]:
+    sent: list[dict] = []
+    received = False
+
+    async def receive():
+        nonlocal received
+        if received:
+            await asyncio.Event().wait()  # no disconnect during the benchmark
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(dict(_SCOPE), receive, send)
+    start = sent[0]
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}
+
+async def _run(app, n: int) -> float:
+    for _ in range(200):  # warm up
+        await _request(app)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        await _request(app)
+    return n / (time.perf_counter() - t0)
+
+
+async def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    access_log.handlers = [logging.NullHandler()]
+    access_log.propagate = False
+    access_log.setLevel(logging.INFO)
+
+    legacy, asgi = _app(legacy=True), _app(legacy=False)
+    (s1, h1), (s2, h2) = await _request(legacy), await _request(asgi)
+    print(f"same status/headers: {s1 == s2 and h1 == h2}")
+    before, after = await _run(legacy, n), await _run(asgi, n)
+    print(f"BaseHTTPMiddleware x3: {before:8.0f} req/s")
+    print(f"pure ASGI x1:          {after:8.0f} req/s   (x{after / before:.2f})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
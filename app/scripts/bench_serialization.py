@@ -0,0 +1,84 @@
+import json
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+from pydantic import TypeAdapter
+from app.api.fast_json import dumps, idea_dict, user_admin_dict
+from app.models.idea import Idea
+from app.models.user import User
+from app.schemas.idea import IdeasPage, IdeasCompactPage
+from app.schemas.user import UserAdminOut
+
+# Serialization cost of one GET /ideas page and one admin users page, old path vs fast path.
+# No database needed:
+#   docker compose exec app python -m app.scripts.bench_serialization [page_size] [repeat]
+
+def _ideas(n: int) -> list[Idea]:
+    now = datetime.now(timezone.utc)
+    owner = User(id=uuid.uuid4(), email="owner@example.com", full_name="Owner Name")
+    return [
+        Idea(
+            id=uuid.uuid4(), title=f"Idea number {i}", description="Lorem ipsum dolor sit amet. " * 20,
+            scalability=1 + i % 5, ease_to_build=1 + i % 4, uses_ai=bool(i % 2), ai_complexity=i % 4,
+            tags=["ai", "web"][: i % 3], score=round(1.5 + (i % 7) / 3, 4),
+            created_at=now - timedelta(minutes=i), updated_at=now, owner_id=owner.id, owner=owner,
+        )
+        for i in range(n)
+    ]
+
+
+def _users(n: int) -> list[User]:
+    now = datetime.now(timezone.utc)
+    return [
+        User(
+            id=uuid.uuid4(), email=f"user{i}@example.com", full_name=f"User {i}",
+            is_active=True, is_verified=bool(i % 2), is_superuser=False, created_at=now - timedelta(days=i),
+        )
+        for i in range(n)
+    ]
+
+
+# What FastAPI does for a dict returned under response_model: validate with
+# from_attributes, dump to JSON-able python, then json.dumps in JSONResponse.
+_PAGE = TypeAdapter(IdeasPage | IdeasCompactPage)
+
+def _stdlib(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def ideas_old(items, page) -> bytes:
+    return _stdlib(_PAGE.dump_python(_PAGE.validate_python({"items": items, **page}, from_attributes=True), mode="json"))
+
+def ideas_fast(items, page) -> bytes:
+    return dumps({"items": [idea_dict(obj) for obj in items], **page})
+
+def users_old(users, page) -> bytes:
+    out = [UserAdminOut.model_validate(u) for u in users]
+    return _stdlib(TypeAdapter(dict).dump_python({"items": out, **page}, mode="json"))
+
+def users_fast(users, page) -> bytes:
+    return dumps({"items": [user_admin_dict(u) for u in users], **page})
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    page = {"total": 1000, "limit": size, "offset": 0, "next_cursor": None, "has_more": True}
+    ideas, users = _ideas(size), _users(size)
+    admin_page = {"total": 1000, "limit": size, "offset": 0, "has_more": True}
+
+    for name, old, fast, rows, extra in (
+        ("ideas", ideas_old, ideas_fast, ideas, page),
+        ("admin users", users_old, users_fast, users, admin_page),
+    ):
+        same = json.loads(old(rows, extra)) == json.loads(fast(rows, extra))
+        t_old = min(timeit.repeat(lambda: old(rows, extra), number=repeat, repeat=3)) / repeat
+        t_fast = min(timeit.repeat(lambda: fast(rows, extra), number=repeat, repeat=3)) / repeat
+        print(
+            f"{name:12} {size} rows  old {t_old * 1e3:7.3f} ms  fast {t_fast * 1e3:7.3f} ms  "
+            f"x{t_old / t_fast:5.1f}  same_json={same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
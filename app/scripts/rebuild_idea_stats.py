@@ -0,0 +1,18 @@
+import asyncio
+import sys
+from uuid import UUID
+from app.db.session import SessionLocal
+from app.services.ideas import rebuild_stats
+
+# Recompute idea_stats from ideas if it ever drifts (the triggers keep it current):
+#   docker compose exec app python -m app.scripts.rebuild_idea_stats [owner_id]
+
+async def main():
+    owner_id = UUID(sys.argv[1]) if len(sys.argv) > 1 else None
+    async with SessionLocal() as db:
+        rows = await rebuild_stats(db, owner_id=owner_id)
+        print(f"Rebuilt idea_stats: owners={rows}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
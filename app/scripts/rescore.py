@@ -0,0 +1,17 @@
+import asyncio
+import sys
+from app.db.session import SessionLocal
+from app.services.ideas import rescore_all
+
+# Run after changing any SCORE_W_* setting:
+#   docker compose exec app python -m app.scripts.rescore [batch_size]
+
+async def main():
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    async with SessionLocal() as db:
+        scanned, updated = await rescore_all(db, batch_size=batch_size)
+        print(f"Rescored ideas: scanned={scanned} updated={updated}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,179 @@
+"""Near-duplicate ideas via MinHash + LSH.
+
+Each idea gets a MinHash signature (``SIG_SIZE`` 32-bit minima over the
+character shingles of its normalised title + description, 256 bytes in
+``ideas.minhash``). The signature is cut into ``BANDS`` bands and each band
+hashed into ``idea_lsh_buckets``; ideas sharing a bucket are candidates, so
+a lookup reads a handful of index entries instead of comparing against every
+idea. Candidates are then ranked by estimated Jaccard similarity (the share
+of equal signature slots).
+
+With 16 bands x 4 rows, pairs above ~0.5 similarity collide with high
+probability and pairs below ~0.3 rarely do.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import zlib
+from typing import Sequence
+from uuid import UUID
+
+import numpy as np
+import sqlalchemy as sa
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.idea import Idea
+from app.models.idea_lsh import IdeaLshBucket
+
+__all__ = [
+    "SIG_SIZE", "BANDS", "DEFAULT_MIN_SIMILARITY",
+    "signature", "band_keys", "similarity", "store", "store_buckets", "find_similar", "backfill",
+]
+
+SHINGLE_CHARS = 5
+SIG_SIZE = 64
+BANDS = 16
+ROWS_PER_BAND = SIG_SIZE // BANDS
+DEFAULT_MIN_SIMILARITY = 0.5
+# Long descriptions: the opening text is what duplicates share
+MAX_TEXT_CHARS = 4000
+# Bucket hits fetched before exact ranking
+_CANDIDATE_CAP = 200
+
+# Universal hashing h(x) = (a*x + b) mod p; fixed seed so signatures are
+# stable across processes and deploys. Changing any of these constants
+# requires re-running app.scripts.backfill_minhash with --all.
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.default_rng(0x1DEA)
+_A = _rng.integers(1, int(_PRIME), size=(SIG_SIZE, 1), dtype=np.uint64)
+_B = _rng.integers(0, int(_PRIME), size=(SIG_SIZE, 1), dtype=np.uint64)
+
+_WORD = re.compile(r"\w+")
+
+
+def _shingle_hashes(text: str) -> np.ndarray:
+    norm = " ".join(_WORD.findall(text[:MAX_TEXT_CHARS].lower()))
+    if len(norm) <= SHINGLE_CHARS:
+        grams = {norm}
+    else:
+        grams = {norm[i:i + SHINGLE_CHARS] for i in range(len(norm) - SHINGLE_CHARS + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def signature(title: str, description: str) -> bytes:
+    """MinHash signature of title + description as ``SIG_SIZE`` little-endian uint32."""
+    x = _shingle_hashes(f"{title} {description}") % _PRIME
+    sig = ((_A * x + _B) % _PRIME).min(axis=1)  # a < 2^31, x < 2^31: no uint64 overflow
+    return sig.astype("<u4").tobytes()
+
+
+def band_keys(sig: bytes) -> list[int]:
+    """One signed 64-bit bucket key per band."""
+    width = ROWS_PER_BAND * 4
+    return [
+        int.from_bytes(hashlib.blake2b(sig[b * width:(b + 1) * width], digest_size=8).digest(), "little", signed=True)
+        for b in range(BANDS)
+    ]
+
+
+def similarity(a: bytes, b: bytes) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(np.frombuffer(a, dtype="<u4") == np.frombuffer(b, dtype="<u4")))
+
+
+async def store(db: AsyncSession, items: Sequence[tuple[UUID, UUID | None, bytes]]) -> None:
+    """Write ``(idea_id, owner_id, signature)`` entries: minhash column and buckets.
+
+    The minhash UPDATE goes first, so concurrent indexers of the same idea
+    queue on its row lock. The caller commits.
+    """
+    if not items:
+        return
+    table = Idea.__table__
+    # index maintenance, not an edit: keep updated_at as it was
+    await db.execute(
+        update(table).where(table.c.id == sa.bindparam("b_id"))
+        .values(minhash=sa.bindparam("b_sig"), updated_at=table.c.updated_at),
+        [{"b_id": idea_id, "b_sig": sig} for idea_id, _, sig in items],
+    )
+    await store_buckets(db, items)
+
+
+async def store_buckets(
+    db: AsyncSession, items: Sequence[tuple[UUID, UUID | None, bytes]], *, replace: bool = True,
+) -> None:
+    """Bucket rows of ideas whose ``minhash`` is already written (e.g. in the same UPDATE).
+
+    Replaces any previous buckets of those ideas; ``replace=False`` is for
+    rows just inserted, which have none. Existing bucket rows are skipped, so
+    two requests indexing the same idea don't fail on the primary key.
+    """
+    if not items:
+        return
+    if replace:
+        ids = [idea_id for idea_id, _, _ in items]
+        await db.execute(delete(IdeaLshBucket).where(IdeaLshBucket.idea_id.in_(ids)))
+    buckets = [
+        {"owner_id": owner_id, "band": band, "bucket": key, "idea_id": idea_id}
+        for idea_id, owner_id, sig in items if owner_id is not None
+        for band, key in enumerate(band_keys(sig))
+    ]
+    if buckets:
+        await db.execute(pg_insert(IdeaLshBucket).on_conflict_do_nothing(), buckets)
+
+
+async def find_similar(
+    db: AsyncSession,
+    *,
+    owner_id: UUID,
+    sig: bytes,
+    exclude_id: UUID | None = None,
+    limit: int = 10,
+    min_similarity: float = DEFAULT_MIN_SIMILARITY,
+) -> list[tuple[UUID, str, float]]:
+    """The owner's ideas similar to ``sig``: ``[(id, title, similarity)]``, best first."""
+    b = IdeaLshBucket
+    keys = [(band, key) for band, key in enumerate(band_keys(sig))]
+    stmt = (
+        select(Idea.id, Idea.title, Idea.minhash)
+        .join(b, b.idea_id == Idea.id)
+        .where(b.owner_id == owner_id, sa.tuple_(b.band, b.bucket).in_(keys), Idea.owner_id == owner_id)
+        .group_by(Idea.id)
+        .order_by(func.count().desc())
+        .limit(_CANDIDATE_CAP)
+    )
+    if exclude_id is not None:
+        stmt = stmt.where(Idea.id != exclude_id)
+    scored = [
+        (iid, title, s)
+        for iid, title, minhash in (await db.execute(stmt)).all()
+        if minhash is not None and (s := similarity(sig, minhash)) >= min_similarity
+    ]
+    scored.sort(key=lambda item: item[2], reverse=True)
+    return scored[:limit]
+
+
+async def backfill(db: AsyncSession, *, batch_size: int = 1000, all_ideas: bool = False) -> int:
+    """Compute signatures for ideas without one (or every idea); returns rows indexed.
+
+    Walks ideas by id and commits per batch (bulk imports leave minhash NULL).
+    """
+    after: UUID | None = None
+    done = 0
+    while True:
+        stmt = select(Idea.id, Idea.owner_id, Idea.title, Idea.description).order_by(Idea.id).limit(batch_size)
+        if not all_ideas:
+            stmt = stmt.where(Idea.minhash.is_(None))
+        if after is not None:
+            stmt = stmt.where(Idea.id > after)
+        rows = (await db.execute(stmt)).all()
+        if not rows:
+            return done
+        await store(db, [(r.id, r.owner_id, signature(r.title, r.description)) for r in rows])
+        await db.commit()
+        done += len(rows)
+        after = rows[-1].id
@@ -0,0 +1,125 @@
+"""Incremental NDJSON / CSV readers for uploaded idea files.
+
+Both readers consume an async stream of byte chunks (``request.stream()``)
+and yield ``(line, row, error)`` per record without buffering the whole
+body: ``line`` is the 1-based physical line the record starts on, ``row`` a
+dict (None when the record can't be parsed) and ``error`` a message.
+:class:`RowSpool` holds validated rows until they are written, in memory up
+to a limit and in a temp file beyond it.
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+import tempfile
+from typing import AsyncIterable, AsyncIterator, Iterator
+
+import orjson
+
+__all__ = ["read_ndjson", "read_csv", "RowSpool"]
+
+ParsedRecord = tuple[int, dict | None, str | None]
+
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Yield decoded physical lines, each keeping its trailing newline."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")  # tolerate Excel's BOM
+    pending = ""
+    async for chunk in chunks:
+        # split on "\n" only: str.splitlines() would also break on characters
+        # like U+2028 that are legitimate inside a description
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def read_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[ParsedRecord]:
+    """One JSON object per line; blank lines are skipped."""
+    line_no = 0
+    async for line in _iter_lines(chunks):
+        line_no += 1
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as exc:
+            yield line_no, None, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(row, dict):
+            yield line_no, None, "Expected a JSON object"
+            continue
+        yield line_no, row, None
+
+
+async def read_csv(chunks: AsyncIterable[bytes], *, list_fields: tuple[str, ...] = ("tags",)) -> AsyncIterator[ParsedRecord]:
+    """CSV with a header row; ``list_fields`` cells hold ``a;b`` lists.
+
+    Quoted fields may span lines: physical lines are joined until the quote
+    count is balanced, then the record is handed to :mod:`csv`. Blank cells
+    are returned as empty strings; callers decide what a blank means.
+    """
+    header: list[str] | None = None
+    record, start, line_no, odd_quotes = "", 0, 0, False
+    async for line in _iter_lines(chunks):
+        line_no += 1
+        if not record:
+            start = line_no
+        record += line
+        odd_quotes ^= line.count('"') % 2 == 1
+        if odd_quotes:
+            continue  # inside a quoted field
+        text, record = record, ""
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        row = dict(zip(header, values))
+        for name in list_fields:
+            if name in row:
+                row[name] = [v.strip() for v in row[name].split(";") if v.strip()]
+        yield start, row, None
+    if record.strip():
+        yield start, None, "Unterminated quoted field"
+
+
+class RowSpool:
+    """Append-only buffer of JSON-able rows, spilling to disk past ``max_memory`` bytes."""
+
+    def __init__(self, *, max_memory: int):
+        self._file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        self.rows = 0
+
+    def append(self, row: dict) -> None:
+        self._file.write(orjson.dumps(row) + b"\n")
+        self.rows += 1
+
+    def chunks(self, size: int) -> Iterator[list[dict]]:
+        """The rows in append order, ``size`` at a time."""
+        self._file.seek(0)
+        chunk: list[dict] = []
+        for line in self._file:
+            chunk.append(orjson.loads(line))
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "RowSpool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
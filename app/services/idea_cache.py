@@ -0,0 +1,253 @@
+"""Optional in-process columnar cache of hot owners' ideas (IDEA_CACHE_ENABLED).
+
+An owner's ideas are loaded once into :class:`OwnerIdeas`: NumPy columns for
+everything ``GET /ideas`` filters or sorts on (created_at, score, uses_ai,
+tag_mask) plus one tuple per idea for building the response. List requests
+without ``q`` are then answered in memory with the same semantics as
+``ideas.list_`` (filters, both sorts and directions, offset or keyset cursor,
+totals). Full-text / trigram search always goes to Postgres.
+
+Entries carry the owner's write version (``ideas.idea_versions``) and the
+ideas service drops them on every write; a TTL bounds staleness from writes
+made outside this process. Eviction is LRU by an approximate memory budget.
+"""
+
+from __future__ import annotations
+
+import bisect
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import register_cache
+from app.core.config import settings
+from app.models.idea import Idea, DESCRIPTION_PREVIEW_CHARS
+from app.models.tag import TAG_BITS, tag_mask
+from app.services.pagination import encode_cursor, decode_cursor_for
+
+__all__ = ["CachedIdea", "OwnerIdeas", "IdeaCache", "idea_cache"]
+
+# Loaded per idea, in this order (CachedIdea mirrors it)
+_COLUMNS = (
+    "id", "title", "description", "scalability", "ease_to_build", "uses_ai",
+    "ai_complexity", "tags", "score", "created_at", "updated_at", "tag_mask",
+)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# rough per-idea overhead of the row tuple, its boxed values and the id list slot
+_ROW_OVERHEAD_BYTES = 400
+# owners remembered as too large to cache
+_OVERSIZED_MAX = 10_000
+
+
+def _micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class CachedIdea:
+    """Attribute view of a cached row, shaped like ``Idea`` for IdeaOut."""
+    __slots__ = (*_COLUMNS, "owner_id", "owner", "snippet")
+
+    def __init__(self, row: tuple, owner_id: UUID):
+        for name, value in zip(_COLUMNS, row):
+            setattr(self, name, value)
+        self.owner_id = owner_id
+        self.owner = None
+        self.snippet = None
+
+    @property
+    def description_preview(self) -> str:
+        return self.description[:DESCRIPTION_PREVIEW_CHARS]
+
+
+class OwnerIdeas:
+    """One owner's ideas as parallel columns, in (created_at, id) order."""
+    __slots__ = (
+        "owner_id", "version", "loaded_at", "rows", "sorted_ids",
+        "created", "score", "uses_ai", "tag_mask", "id_rank", "orders", "nbytes",
+    )
+
+    def __init__(self, owner_id: UUID, version: str, rows: Sequence[tuple]):
+        self.owner_id = owner_id
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.rows = tuple(rows)
+        ids = [row[0] for row in self.rows]
+        self.sorted_ids = sorted(ids)
+        rank = {iid: i for i, iid in enumerate(self.sorted_ids)}
+        self.id_rank = np.fromiter((rank[iid] for iid in ids), dtype=np.int64, count=len(ids))
+        self.created = np.fromiter((_micros(row[9]) for row in self.rows), dtype=np.int64, count=len(ids))
+        self.score = np.fromiter((row[8] for row in self.rows), dtype=np.float64, count=len(ids))
+        self.uses_ai = np.fromiter((row[5] for row in self.rows), dtype=np.bool_, count=len(ids))
+        self.tag_mask = np.fromiter((row[11] for row in self.rows), dtype=np.int32, count=len(ids))
+        # ascending (key, id) permutations; descending is the reverse
+        self.orders = {
+            "created_at": np.lexsort((self.id_rank, self.created)),
+            "score": np.lexsort((self.id_rank, self.score)),
+        }
+        arrays = (self.id_rank, self.created, self.score, self.uses_ai, self.tag_mask, *self.orders.values())
+        text = sum(len(row[1]) + len(row[2]) for row in self.rows)
+        self.nbytes = sum(a.nbytes for a in arrays) + text + len(self.rows) * _ROW_OVERHEAD_BYTES + sys.getsizeof(self.rows)
+
+    def _mask(self, uses_ai, min_score, max_score, tags_any, tags_all) -> np.ndarray:
+        mask = np.ones(len(self.rows), dtype=np.bool_)
+        if uses_ai is not None:
+            mask &= self.uses_ai == uses_ai
+        if min_score is not None:
+            mask &= self.score >= min_score
+        if max_score is not None:
+            mask &= self.score <= max_score
+        if tags_any:
+            mask &= (self.tag_mask & tag_mask(tags_any)) != 0
+        if tags_all:
+            m = tag_mask(tags_all)
+            if all(t in TAG_BITS for t in tags_all):
+                mask &= (self.tag_mask & m) == m
+            else:
+                mask[:] = False
+        return mask
+
+    def page(
+        self, *, limit: int, offset: int, sort: str, order: str,
+        uses_ai=None, min_score=None, max_score=None, tags_any=None, tags_all=None,
+        cursor: str | None = None, count: str = "exact", fields: Sequence[str] | None = None,
+    ) -> tuple[list, int | None, str | None]:
+        """Same contract as ``ideas.list_`` for requests without ``q``."""
+        sort = sort if sort in self.orders else "created_at"
+        order = "asc" if order.lower() == "asc" else "desc"
+        keys = self.created if sort == "created_at" else self.score
+
+        idx = self.orders[sort]
+        idx = idx[self._mask(uses_ai, min_score, max_score, tags_any, tags_all)[idx]]
+        if order == "desc":
+            idx = idx[::-1]
+        total = int(idx.shape[0]) if count != "none" else None
+
+        if cursor:
+            c_key, c_id = decode_cursor_for(cursor, sort, order)
+            key = _micros(c_key) if sort == "created_at" else c_key
+            k, r = keys[idx], self.id_rank[idx]
+            if order == "asc":  # (key, id) > cursor
+                after = (k > key) | ((k == key) & (r >= bisect.bisect_right(self.sorted_ids, c_id)))
+            else:               # (key, id) < cursor
+                after = (k < key) | ((k == key) & (r < bisect.bisect_left(self.sorted_ids, c_id)))
+            idx = idx[after]
+            offset = 0
+
+        window = idx[offset:offset + limit + 1].tolist()
+        chosen = window[:limit]
+        if fields:
+            names = ["id", *(f for f in fields if f != "id")]
+            items: list = []
+            for i in chosen:
+                view = CachedIdea(self.rows[i], self.owner_id)
+                items.append({name: getattr(view, name) for name in names})
+        else:
+            items = [CachedIdea(self.rows[i], self.owner_id) for i in chosen]
+
+        next_cursor = None
+        if len(window) > limit and chosen:
+            last = self.rows[chosen[-1]]
+            next_cursor = encode_cursor(sort, order, last[9] if sort == "created_at" else last[8], last[0])
+        return items, total, next_cursor
+
+
+class IdeaCache:
+    """LRU of :class:`OwnerIdeas` bounded by ``max_bytes``."""
+
+    def __init__(self, *, enabled: bool, max_bytes: int, max_rows: int, ttl: float):
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, OwnerIdeas] = OrderedDict()
+        # owners too large to cache, by the version that was checked (LRU,
+        # capped: a forgotten owner just costs one more bounded load query)
+        self._oversized: OrderedDict[UUID, str] = OrderedDict()
+        self.bytes = 0
+        self.hits = self.misses = self.loads = self.evictions = self.skipped = 0
+
+    async def get(self, db: AsyncSession, owner_id: UUID, version: str) -> OwnerIdeas | None:
+        """The owner's entry at ``version``, loading it on a miss; None if not cacheable."""
+        entry = self._entries.get(owner_id)
+        if entry is not None and entry.version == version and time.monotonic() - entry.loaded_at < self.ttl:
+            self._entries.move_to_end(owner_id)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        if entry is not None:
+            self.invalidate(owner_id)
+        if self._oversized.get(owner_id) == version:
+            self.skipped += 1
+            return None
+
+        stmt = (
+            select(*(getattr(Idea, name) for name in _COLUMNS))
+            .where(Idea.owner_id == owner_id)
+            .order_by(Idea.created_at, Idea.id)
+            .limit(self.max_rows + 1)
+        )
+        rows = (await db.execute(stmt)).all()
+        if len(rows) > self.max_rows:
+            self._mark_oversized(owner_id, version)
+            self.skipped += 1
+            return None
+        entry = OwnerIdeas(owner_id, version, rows)
+        self.loads += 1
+        if entry.nbytes > self.max_bytes:
+            self._mark_oversized(owner_id, version)
+            self.skipped += 1
+            return None
+        self._entries[owner_id] = entry
+        self.bytes += entry.nbytes
+        while self.bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.nbytes
+            self.evictions += 1
+        return entry
+
+    def _mark_oversized(self, owner_id: UUID, version: str) -> None:
+        self._oversized[owner_id] = version
+        self._oversized.move_to_end(owner_id)
+        while len(self._oversized) > _OVERSIZED_MAX:
+            self._oversized.popitem(last=False)
+
+    def invalidate(self, owner_id: UUID) -> None:
+        entry = self._entries.pop(owner_id, None)
+        if entry is not None:
+            self.bytes -= entry.nbytes
+        self._oversized.pop(owner_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._oversized.clear()
+        self.bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "owners": len(self._entries),
+            "ideas": sum(len(e.rows) for e in self._entries.values()),
+            "bytes": self.bytes, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "loads": self.loads, "evictions": self.evictions, "skipped": self.skipped,
+            "oversized_owners": len(self._oversized),
+        }
+
+
+idea_cache = IdeaCache(
+    enabled=settings.IDEA_CACHE_ENABLED,
+    max_bytes=settings.IDEA_CACHE_MAX_MB * 1024 * 1024,
+    max_rows=settings.IDEA_CACHE_MAX_ROWS,
+    ttl=settings.IDEA_CACHE_TTL_SECONDS,
+)
+register_cache("ideas_columnar", idea_cache)
@@ -1,51 +1,213 @@
 import sqlalchemy as sa
-from typing import Sequence
-from sqlalchemy import select, func
+from typing import AsyncIterator, Iterable, Sequence
+from sqlalchemy import select, func, insert, update, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import selectinload
-from app.models.idea import Idea
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm.attributes import set_committed_value
+from app.models.idea import Idea, FTS_CONFIG, score_function_sql
+from app.models.user import User
+from app.models.tag import TAG_BITS, TagRegistry, tag_mask
+from app.models.idea_stats import IdeaStats, STATS_BUCKETS, STATS_BUCKET_SQL
+from app.services.pagination import encode_cursor, decode_cursor_for, estimate_count
+from app.services.search import like_pattern, set_similarity_threshold, DEFAULT_SIMILARITY
+from app.core.cache import TTLCache, WriteVersions
+from app.services.idea_cache import idea_cache
+from app.services import dedup
 from uuid import UUID    
+from datetime import datetime
 
-def _build_filters(q: str | None, uses_ai: bool | None, min_score: float | None, max_score: float | None, owner_id: UUID, tags_any: Sequence[str] | None):
+# Columns a client may change (IdeaUpdate)
+_UPDATABLE = ("title", "description", "scalability", "ease_to_build", "uses_ai", "ai_complexity", "tags")
+
+# Highlighted description fragments for ?highlight=true
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=5"
+
+def _html_escape(expr):
+    # snippets are HTML (<mark>): escape the user-written text around the marks
+    for char, entity in (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;")):
+        expr = func.replace(expr, char, entity)
+    return expr
+
+# explicit regconfig: asyncpg binds strings as VARCHAR, which won't cast implicitly
+_FTS_REGCONFIG = sa.literal_column(f"'{FTS_CONFIG}'::regconfig")
+
+def _ts_query(q: str):
+    # websearch syntax: "quoted phrases", -exclusions, OR
+    return func.websearch_to_tsquery(_FTS_REGCONFIG, q)
+
+def _build_filters(q: str | None, uses_ai: bool | None, min_score: float | None, max_score: float | None, owner_id: UUID, tags_any: Sequence[str] | None, match: str = "fts", tags_all: Sequence[str] | None = None):
     filters = []
     filters.append(Idea.owner_id == owner_id)
 
-    if q:
-        like = f"%{q}%"
-        filters.append(sa.or_(Idea.title.ilike(like), Idea.description.ilike(like)))
+    if q and match == "trigram":
+        # substring OR typo-tolerant title match; both use ix_ideas_title_trgm
+        filters.append(sa.or_(Idea.title.ilike(like_pattern(q), escape="\\"), Idea.title.op("%")(q)))
+    elif q:
+        filters.append(Idea.search_vector.op("@@")(_ts_query(q)))
     if uses_ai is not None:
         filters.append(Idea.uses_ai.is_(uses_ai))
     if min_score is not None:
         filters.append(Idea.score >= min_score)
     if max_score is not None:
         filters.append(Idea.score <= max_score)
-    if tags_any:  # NEW: overlap (ANY of these tags)
-        filters.append(Idea.tags.op("&&")(sa.cast(tags_any, ARRAY(sa.String()))))
+    if tags_any:  # ANY of these tags: tag_mask & m <> 0
+        filters.append(Idea.tag_mask.op("&")(tag_mask(tags_any)) != 0)
+    if tags_all:  # ALL of these tags: tag_mask & m = m (an unknown slug matches nothing)
+        mask = tag_mask(tags_all)
+        known = all(t in TAG_BITS for t in tags_all)
+        filters.append(Idea.tag_mask.op("&")(mask) == mask if known else sa.false())
     return filters
 
+# Bumped after every committed write to an owner's ideas; cached reads key on it
+idea_versions = WriteVersions()
+
+def _touch(owner_id: UUID) -> None:
+    idea_versions.bump(owner_id)
+    idea_cache.invalidate(owner_id)
+
+async def _attach_owner(db: AsyncSession, objs: Sequence[Idea], owner_id: UUID) -> None:
+    # Every row belongs to owner_id, so fill the relationship from the identity
+    # map (get_current_user loaded it into this session) instead of a SELECT.
+    owner = await db.get(User, owner_id)
+    for obj in objs:
+        set_committed_value(obj, "owner", owner)
+
 async def create(db: AsyncSession, data: dict, *, owner_id: UUID) -> Idea:
-    data = {**data, "owner_id": owner_id}
-    obj = Idea(**data)
-    db.add(obj)
+    # INSERT ... RETURNING: defaults, score and timestamps come back in one round trip
+    sig = dedup.signature(data["title"], data["description"])
+    stmt = insert(Idea).values({**data, "owner_id": owner_id, "minhash": sig}).returning(Idea)
+    obj = (await db.scalars(stmt)).one()
+    await dedup.store_buckets(db, [(obj.id, owner_id, sig)], replace=False)
     await db.commit()
-    await db.refresh(obj, attribute_names=["owner"])
+    _touch(owner_id)
+    await _attach_owner(db, [obj], owner_id)
     return obj
 
+# ---------------- batch writes (one transaction each) ----------------
+async def create_many(db: AsyncSession, rows: Sequence[dict], *, owner_id: UUID) -> list[Idea]:
+    """Multi-row INSERT ... RETURNING; results are in the same order as ``rows``."""
+    if not rows:
+        return []
+    values = [{**row, "owner_id": owner_id, "minhash": dedup.signature(row["title"], row["description"])} for row in rows]
+    stmt = insert(Idea).returning(Idea, sort_by_parameter_order=True)
+    objs = list((await db.scalars(stmt, values)).all())
+    await dedup.store_buckets(db, [(obj.id, owner_id, v["minhash"]) for obj, v in zip(objs, values)], replace=False)
+    await db.commit()
+    _touch(owner_id)
+    await _attach_owner(db, objs, owner_id)
+    return objs
+
+async def update_many(db: AsyncSession, rows: Sequence[dict], *, owner_id: UUID) -> dict[UUID, Idea]:
+    """``UPDATE ideas ... FROM (VALUES ...)`` keyed by ``row["id"]``.
+
+    Like ``update_``, None values leave the column unchanged, and rows with
+    nothing to change are only read (no write, no version bump). Returns the
+    ideas by id; ids missing from the result were not found.
+    """
+    unchanged = [row["id"] for row in rows if all(row.get(c) is None for c in _UPDATABLE)]
+    rows = [row for row in rows if any(row.get(c) is not None for c in _UPDATABLE)]
+    if not rows:
+        return await get_many(db, unchanged, owner_id=owner_id)
+    names = [c for c in _UPDATABLE if any(row.get(c) is not None for row in rows)]
+    text_changed = "title" in names or "description" in names
+    # rows giving both texts get their signature in the same UPDATE
+    sigs = {
+        row["id"]: dedup.signature(row["title"], row["description"])
+        for row in rows if row.get("title") is not None and row.get("description") is not None
+    }
+    if sigs:
+        names.append("minhash")
+    v = sa.values(
+        sa.column("id", PG_UUID(as_uuid=True)),
+        *(sa.column(name, Idea.__table__.c[name].type) for name in names),
+        name="v",
+    ).data([(row["id"], *(sigs.get(row["id"]) if name == "minhash" else row.get(name) for name in names)) for row in rows])
+    stmt = (
+        update(Idea)
+        .where(Idea.id == v.c.id, Idea.owner_id == owner_id)
+        .values({name: func.coalesce(v.c[name], Idea.__table__.c[name]) for name in names})
+        .returning(Idea)
+        .execution_options(synchronize_session=False)
+    )
+    objs = list((await db.scalars(stmt)).all())
+    if text_changed:
+        # a row changing only one text needs the stored other one: sign it now
+        one_text = {row["id"] for row in rows if (row.get("title") is None) != (row.get("description") is None)}
+        partial = [(obj.id, owner_id, dedup.signature(obj.title, obj.description)) for obj in objs if obj.id in one_text]
+        await dedup.store(db, partial)
+        await dedup.store_buckets(db, [(obj.id, owner_id, sigs[obj.id]) for obj in objs if obj.id in sigs])
+    await db.commit()
+    _touch(owner_id)
+    await _attach_owner(db, objs, owner_id)
+    return {**await get_many(db, unchanged, owner_id=owner_id), **{obj.id: obj for obj in objs}}
+
+async def delete_many(db: AsyncSession, ids: Sequence[UUID], *, owner_id: UUID) -> set[UUID]:
+    """``DELETE ... WHERE id = ANY(:ids)``; returns the ids actually deleted."""
+    if not ids:
+        return set()
+    stmt = (
+        delete(Idea)
+        .where(Idea.id == sa.any_(sa.cast(list(ids), ARRAY(PG_UUID(as_uuid=True)))), Idea.owner_id == owner_id)
+        .returning(Idea.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted = set((await db.scalars(stmt)).all())
+    await db.commit()
+    _touch(owner_id)
+    return deleted
+
 async def get(db: AsyncSession, idea_id: str, *, owner_id: UUID) -> Idea | None:
     try:
         iid = UUID(idea_id)
     except ValueError:
         return None
-    res = await db.execute(select(Idea).options(selectinload(Idea.owner)).where(Idea.id == iid, Idea.owner_id == owner_id))
+    obj = (await db.scalars(select(Idea).where(Idea.id == iid, Idea.owner_id == owner_id))).one_or_none()
+    if obj is not None:
+        await _attach_owner(db, [obj], owner_id)
+    return obj
 
-    return res.scalar_one_or_none()
+async def get_version(db: AsyncSession, idea_id: str, *, owner_id: UUID) -> tuple[datetime, float] | None:
+    """The idea's ``(updated_at, score)`` (its ETag inputs) without loading the row; None if not found.
+
+    score is included because app.scripts.rescore rewrites it without
+    touching updated_at.
+    """
+    try:
+        iid = UUID(idea_id)
+    except ValueError:
+        return None
+    stmt = select(Idea.updated_at, Idea.score).where(Idea.id == iid, Idea.owner_id == owner_id)
+    row = (await db.execute(stmt)).one_or_none()
+    return tuple(row) if row is not None else None
+
+async def get_many(db: AsyncSession, ids: Sequence[UUID], *, owner_id: UUID) -> dict[UUID, Idea]:
+    """The owner's ideas among ``ids``, keyed by id (missing ids are skipped)."""
+    if not ids:
+        return {}
+    objs = list((await db.scalars(select(Idea).where(Idea.id.in_(ids), Idea.owner_id == owner_id))).all())
+    await _attach_owner(db, objs, owner_id)
+    return {obj.id: obj for obj in objs}
+
+async def similar(
+    db: AsyncSession, idea: Idea, *, owner_id: UUID, limit: int = 10,
+    min_similarity: float = dedup.DEFAULT_MIN_SIMILARITY,
+) -> list[tuple[UUID, str, float]]:
+    """Likely duplicates of ``idea`` among the owner's other ideas, best first.
+
+    Ideas without a signature yet (bulk imported) are indexed on the way.
+    """
+    sig = (await db.execute(select(Idea.minhash).where(Idea.id == idea.id))).scalar_one_or_none()
+    if sig is None:
+        sig = dedup.signature(idea.title, idea.description)
+        await dedup.store(db, [(idea.id, owner_id, sig)])
+        await db.commit()
+    return await dedup.find_similar(db, owner_id=owner_id, sig=sig, exclude_id=idea.id, limit=limit, min_similarity=min_similarity)
 
 async def list_(
     db: AsyncSession,
     limit: int = 20,
     offset: int = 0,
-    sort: str = "created_at",      # "created_at" | "score"
+    sort: str = "created_at",      # "created_at" | "score" | "relevance" (needs q)
     order: str = "desc",           # "asc" | "desc"
     q: str | None = None,
     uses_ai: bool | None = None,
@@ -53,40 +215,298 @@ async def list_(
     max_score: float | None = None,
     *,
     owner_id: UUID,
-    tags_any: Sequence[str] | None = None
+    tags_any: Sequence[str] | None = None,
+    tags_all: Sequence[str] | None = None,
+    cursor: str | None = None,
+    highlight: bool = False,
+    match: str = "fts",            # "fts" | "trigram"
+    similarity: float = DEFAULT_SIMILARITY,
+    count: str = "exact",          # "exact" | "estimate" | "none"
+    fields: Sequence[str] | None = None,
+    with_owner: bool = True,
 ):
-    filters = _build_filters(q, uses_ai, min_score, max_score, owner_id, tags_any)
+    """Return ``(rows, total, next_cursor)``.
+
+    With ``cursor`` the page starts right after the row it encodes (keyset
+    pagination, ``offset`` is ignored); otherwise it is a classic LIMIT/OFFSET
+    page. ``next_cursor`` is set whenever more rows follow. With ``q`` and
+    ``highlight`` each row gets a ``snippet`` of matching description text.
+    ``match="trigram"`` searches titles by substring or trigram ``similarity``
+    instead of full-text.
+
+    ``count`` picks how ``total`` is computed: ``exact`` (a window count in the
+    page query for offset pages), ``estimate`` (planner rows) or ``none``
+    (``total`` is None; callers use ``next_cursor is not None`` as has_more).
+
+    ``fields`` (Idea column names, validated by the caller) selects just those
+    columns and returns plain dicts instead of ORM objects. Otherwise rows are
+    ``Idea`` objects whose ``owner`` is taken from the session (the current
+    user is already loaded there) unless ``with_owner`` is False. With
+    IDEA_CACHE_ENABLED, requests without ``q`` may be answered from
+    ``idea_cache`` and rows are then ``CachedIdea`` views of the same shape.
+    """
+    # no q: a hot owner's page can be served from the columnar cache
+    if not q and idea_cache.enabled:
+        entry = await idea_cache.get(db, owner_id, idea_versions.get(owner_id))
+        if entry is not None:
+            rows, total, next_cursor = entry.page(
+                limit=limit, offset=offset, sort=sort, order=order, uses_ai=uses_ai,
+                min_score=min_score, max_score=max_score, tags_any=tags_any, tags_all=tags_all,
+                cursor=cursor, count=count, fields=fields,
+            )
+            if with_owner and rows and not fields:
+                owner = await db.get(User, owner_id)
+                for obj in rows:
+                    obj.owner = owner
+            return rows, total, next_cursor
+
+    trigram = bool(q) and match == "trigram"
+    filters = _build_filters(q, uses_ai, min_score, max_score, owner_id, tags_any, match, tags_all)
 
     sort_map = {"created_at": Idea.created_at, "score": Idea.score}
-    sort_col = sort_map.get(sort, Idea.created_at)
-    order_by = sort_col.desc() if order.lower() == "desc" else sort_col.asc()
+    if trigram:
+        sort_map["relevance"] = func.similarity(Idea.title, q, type_=sa.Float)
+        await set_similarity_threshold(db, similarity)
+    elif q:
+        sort_map["relevance"] = func.ts_rank(Idea.search_vector, _ts_query(q), type_=sa.Float)
+    sort = sort if sort in sort_map else "created_at"
+    order = "asc" if order.lower() == "asc" else "desc"
+    sort_col = sort_map[sort]
+
+    # keyset: seek past (sort_key, id) of the previous page's last row
+    if cursor:
+        c_key, c_id = decode_cursor_for(cursor, sort, order)
+        row_key = sa.tuple_(sort_col, Idea.id)
+        after = sa.tuple_(sa.literal(c_key, sort_col.type), sa.literal(c_id, Idea.id.type))
+        filters.append(row_key > after if order == "asc" else row_key < after)
+        offset = 0
+    count_filters = filters[:-1] if cursor else filters
+
+    # exact total in the same round trip; with a cursor the window would only
+    # see the rows after it, so that case falls back to a separate count
+    fold_total = count == "exact" and not cursor
+
+    # stable ordering: sort column then id as tie-breaker (matches the composite indexes)
+    if order == "desc":
+        order_by = (sort_col.desc(), Idea.id.desc())
+    else:
+        order_by = (sort_col.asc(), Idea.id.asc())
 
-    # rows
-    stmt = select(Idea).options(selectinload(Idea.owner)).where(*filters).order_by(order_by).limit(limit).offset(offset)
-    rows = (await db.execute(stmt)).scalars().all()
+    if fields:
+        names = ["id", *(f for f in fields if f != "id")]
+        columns = [*(getattr(Idea, name) for name in names), sort_col.label("sort_key")]
+    else:
+        columns = [Idea, sort_col.label("sort_key")]
+    if q and highlight and not trigram:
+        columns.append(func.ts_headline(_FTS_REGCONFIG, _html_escape(Idea.description), _ts_query(q), _HEADLINE_OPTIONS).label("snippet"))
+    if fold_total:
+        columns.append(func.count().over().label("full_count"))
 
-    # total (same filters, no limit/offset)
-    count_stmt = select(func.count()).select_from(select(Idea.id).where(*filters).subquery())
-    total = (await db.execute(count_stmt)).scalar_one()
+    # rows (fetch one extra to know whether another page follows)
+    stmt = (
+        select(*columns)
+        .where(*filters)
+        .order_by(*order_by)
+        .limit(limit + 1)
+        .offset(offset)
+    )
+    result = (await db.execute(stmt)).all()
+    page = result[:limit]
+    rows = []
+    if fields:
+        for row in page:
+            item = {name: row._mapping[name] for name in names}
+            if "snippet" in row._fields:
+                item["snippet"] = row.snippet
+            rows.append(item)
+    else:
+        for row in page:
+            obj = row[0]
+            if "snippet" in row._fields:
+                obj.snippet = row.snippet  # plain attribute, read by IdeaOut.snippet
+            rows.append(obj)
+        if with_owner and rows:
+            await _attach_owner(db, rows, owner_id)
+    next_cursor = None
+    if len(result) > limit and page:
+        last = page[-1]
+        next_cursor = encode_cursor(sort, order, last.sort_key, last._mapping["id"] if fields else last[0].id)
 
-    return rows, total
+    # total (same filters, no limit/offset/cursor)
+    total = None
+    if fold_total and result:
+        total = result[0].full_count
+    elif fold_total and offset == 0:
+        total = 0
+    elif count == "exact":
+        count_stmt = select(func.count()).select_from(select(Idea.id).where(*count_filters).subquery())
+        total = (await db.execute(count_stmt)).scalar_one()
+    elif count == "estimate":
+        total = await estimate_count(db, select(Idea.id).where(*count_filters))
+
+    return rows, total, next_cursor
+
+async def tag_registry_drift(db: AsyncSession) -> list[str]:
+    """Slugs whose bit differs between TAG_REGISTRY (code) and tag_registry (DB)."""
+    db_bits = dict((await db.execute(select(TagRegistry.slug, TagRegistry.bit))).all())
+    return sorted(slug for slug in TAG_BITS.keys() | db_bits.keys() if TAG_BITS.get(slug) != db_bits.get(slug))
+
+# Facets: per-owner results live until that owner's next write (version in the key)
+_tag_counts_cache = TTLCache("idea_tag_counts", maxsize=2048, ttl=300)
+
+async def tag_counts(
+    db: AsyncSession,
+    *,
+    owner_id: UUID,
+    q: str | None = None,
+    uses_ai: bool | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    tags_any: Sequence[str] | None = None,
+    tags_all: Sequence[str] | None = None,
+    match: str = "fts",
+    similarity: float = DEFAULT_SIMILARITY,
+) -> dict[str, int]:
+    """Return ``{tag: n_ideas}`` over the ideas matching the list filters.
+
+    Counted from ``tag_mask`` bits in a single aggregate row (no unnest);
+    tags with no ideas are omitted.
+    """
+    trigram = bool(q) and match == "trigram"
+    key = (
+        owner_id, idea_versions.get(owner_id), q, match if q else None, similarity if trigram else None,
+        uses_ai, min_score, max_score,
+        tuple(sorted(tags_any)) if tags_any else None, tuple(sorted(tags_all)) if tags_all else None,
+    )
+    cached = _tag_counts_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if trigram:
+        await set_similarity_threshold(db, similarity)
+    # one pass over the owner's matching rows, one bit test per registered tag
+    stmt = (
+        select(*(
+            func.count().filter(Idea.tag_mask.op("&")(1 << bit) != 0).label(slug)
+            for slug, bit in TAG_BITS.items()
+        ))
+        .where(*_build_filters(q, uses_ai, min_score, max_score, owner_id, tags_any, match, tags_all))
+    )
+    row = (await db.execute(stmt)).one()
+    counts = {slug: n for slug, n in row._mapping.items() if n}
+    _tag_counts_cache.set(key, counts)
+    return counts
+
+# Columns written by /ideas/export (and accepted back by /ideas/import)
+EXPORT_COLUMNS = (
+    "id", "title", "description", "scalability", "ease_to_build", "uses_ai",
+    "ai_complexity", "tags", "score", "created_at", "updated_at",
+)
+
+async def export_(
+    db: AsyncSession,
+    *,
+    owner_id: UUID,
+    q: str | None = None,
+    uses_ai: bool | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    tags_any: Sequence[str] | None = None,
+    tags_all: Sequence[str] | None = None,
+    match: str = "fts",
+    similarity: float = DEFAULT_SIMILARITY,
+    batch_size: int = 1000,
+) -> AsyncIterator[Sequence[sa.Row]]:
+    """Yield the owner's matching ideas in batches of ``batch_size`` rows.
+
+    Rows (``EXPORT_COLUMNS``, oldest first) come from a server-side cursor, so
+    memory stays bounded by one batch however many ideas match. The session
+    must stay open while the generator is consumed.
+    """
+    if q and match == "trigram":
+        await set_similarity_threshold(db, similarity)
+    stmt = (
+        select(*(getattr(Idea, name) for name in EXPORT_COLUMNS))
+        .where(*_build_filters(q, uses_ai, min_score, max_score, owner_id, tags_any, match, tags_all))
+        .order_by(Idea.created_at, Idea.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
+# Bulk import: COPY validated rows into a per-transaction staging table, then
+# move them into ideas with one INSERT ... SELECT (the score trigger still runs)
+IMPORT_COLUMNS = ("title", "description", "scalability", "ease_to_build", "uses_ai", "ai_complexity", "tags")
+
+_IMPORT_STAGE = sa.table("ideas_import_stage", *(sa.column(name) for name in IMPORT_COLUMNS))
+
+_CREATE_IMPORT_STAGE_SQL = sa.text("""
+CREATE TEMP TABLE ideas_import_stage (
+    title varchar(200) NOT NULL,
+    description text NOT NULL,
+    scalability integer NOT NULL,
+    ease_to_build integer NOT NULL,
+    uses_ai boolean NOT NULL,
+    ai_complexity integer NOT NULL,
+    tags varchar(30)[] NOT NULL
+) ON COMMIT DROP
+""")
+
+async def import_(db: AsyncSession, chunks: Iterable[Sequence[dict]], *, owner_id: UUID) -> int:
+    """Insert every validated row from ``chunks`` for ``owner_id``; return the count.
+
+    Each chunk goes through asyncpg ``copy_records_to_table`` (binary COPY), so
+    only one chunk is held in memory. Everything runs in one transaction: on
+    error nothing is imported. ``chunks`` should already be local (e.g. a
+    :class:`~app.services.file_formats.RowSpool`): the transaction and its
+    connection stay open while it is read.
+    """
+    await db.execute(_CREATE_IMPORT_STAGE_SQL)
+    raw = await (await db.connection()).get_raw_connection()
+    pg = raw.driver_connection  # asyncpg connection, inside the session's transaction
+    for chunk in chunks:
+        if chunk:
+            records = [tuple(row[name] for name in IMPORT_COLUMNS) for row in chunk]
+            await pg.copy_records_to_table("ideas_import_stage", records=records, columns=IMPORT_COLUMNS)
+    stmt = insert(Idea.__table__).from_select(
+        ["id", *IMPORT_COLUMNS, "owner_id"],
+        select(
+            func.gen_random_uuid(),
+            *(_IMPORT_STAGE.c[name] for name in IMPORT_COLUMNS),
+            sa.literal(owner_id, PG_UUID(as_uuid=True)),
+        ),
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    _touch(owner_id)
+    return result.rowcount
 
 async def update_(db: AsyncSession, idea_id: str, data: dict, *, owner_id: UUID) -> Idea | None:
     try:
         iid = UUID(idea_id)
     except ValueError:
         return None
-    res = await db.execute(select(Idea).where(Idea.id == iid, Idea.owner_id == owner_id))
-
-    obj = res.scalar_one_or_none()
-    if not obj:
-        return None
-    for k, v in data.items():
-        if v is not None:
-            setattr(obj, k, v)
+    values = {k: v for k, v in data.items() if v is not None}
+    if not values:
+        return await get(db, idea_id, owner_id=owner_id)
+    text_changed = "title" in values or "description" in values
+    if "title" in values and "description" in values:
+        values["minhash"] = dedup.signature(values["title"], values["description"])
+    # UPDATE ... WHERE id AND owner_id RETURNING: ownership check, write and
+    # response row in a single statement
+    stmt = update(Idea).where(Idea.id == iid, Idea.owner_id == owner_id).values(**values).returning(Idea)
+    obj = (await db.scalars(stmt)).one_or_none()
+    if obj is not None and text_changed:
+        if "minhash" in values:
+            await dedup.store_buckets(db, [(obj.id, owner_id, values["minhash"])])
+        else:
+            # only one of title/description sent: the signature needs the stored other one
+            await dedup.store(db, [(obj.id, owner_id, dedup.signature(obj.title, obj.description))])
     await db.commit()
-    await db.refresh(obj)
-    await db.refresh(obj, attribute_names=["owner"]) 
+    _touch(owner_id)
+    if obj is not None:
+        await _attach_owner(db, [obj], owner_id)
     return obj
 
 async def delete_(db: AsyncSession, idea_id: str, *, owner_id: UUID) -> bool:
@@ -94,36 +514,113 @@ async def delete_(db: AsyncSession, idea_id: str, *, owner_id: UUID) -> bool:
         iid = UUID(idea_id)
     except ValueError:
         return False
-    res = await db.execute(select(Idea).where(Idea.id == iid, Idea.owner_id == owner_id))
-    
-    obj = res.scalar_one_or_none()
-    if not obj:
-        return False
-    await db.delete(obj)
+    stmt = delete(Idea).where(Idea.id == iid, Idea.owner_id == owner_id).returning(Idea.id)
+    deleted = (await db.scalars(stmt)).one_or_none()
     await db.commit()
-    return True 
+    _touch(owner_id)
+    return deleted is not None
 
-# Convenience helpers (add/remove) – purely in DB
-async def add_tags(db: AsyncSession, idea_id: str, tags: Sequence[str], *, owner_id: UUID) -> Idea | None:
-    obj = await get(db, idea_id, owner_id=owner_id)
-    if not obj:
+# Convenience helpers (add/remove) – purely in DB, one atomic UPDATE ... RETURNING
+def _tags_array(values):
+    return sa.cast(list(values), ARRAY(sa.String(30)))
+
+async def _update_tags(db: AsyncSession, idea_id: str, new_tags, *, owner_id: UUID) -> Idea | None:
+    try:
+        iid = UUID(idea_id)
+    except ValueError:
         return None
-    current = set(obj.tags or [])
-    newset = sorted(current.union(tags))
-    obj.tags = newset
+    # The SET expression reads the row's current tags under the row lock, so
+    # concurrent add/remove calls compose instead of overwriting each other.
+    stmt = (
+        update(Idea)
+        .where(Idea.id == iid, Idea.owner_id == owner_id)
+        .values(tags=new_tags)
+        .returning(Idea)
+        .execution_options(synchronize_session=False)
+    )
+    obj = (await db.scalars(stmt)).one_or_none()
     await db.commit()
-    await db.refresh(obj)
-    await db.refresh(obj, attribute_names=["owner"])
+    _touch(owner_id)
+    if obj is not None:
+        await _attach_owner(db, [obj], owner_id)
     return obj
 
+async def add_tags(db: AsyncSession, idea_id: str, tags: Sequence[str], *, owner_id: UUID) -> Idea | None:
+    # tags = ARRAY(SELECT DISTINCT t FROM unnest(tags || :tags) t ORDER BY t)
+    t = func.unnest(Idea.tags.concat(_tags_array(tags))).column_valued("t")
+    union = func.array(select(t).distinct().order_by(t).scalar_subquery())
+    return await _update_tags(db, idea_id, union, owner_id=owner_id)
+
 async def remove_tags(db: AsyncSession, idea_id: str, tags: Sequence[str], *, owner_id: UUID) -> Idea | None:
-    obj = await get(db, idea_id, owner_id=owner_id)
-    if not obj:
-        return None
-    current = set(obj.tags or [])
-    newset = sorted(current.difference(tags))
-    obj.tags = newset
+    # tags = ARRAY(SELECT t FROM unnest(tags) t WHERE NOT t = ANY(:tags) ORDER BY t)
+    t = func.unnest(Idea.tags).column_valued("t")
+    difference = func.array(select(t).where(sa.not_(t == sa.any_(_tags_array(tags)))).order_by(t).scalar_subquery())
+    return await _update_tags(db, idea_id, difference, owner_id=owner_id)
+
+# Re-scoring after SCORE_W_* changes: refresh idea_score() then walk the table by id
+_RESCORE_BATCH_SQL = sa.text("""
+WITH batch AS (
+    SELECT id FROM ideas WHERE (CAST(:after AS uuid) IS NULL OR id > :after) ORDER BY id LIMIT :batch_size
+), upd AS (
+    UPDATE ideas i
+    SET score = idea_score(i.scalability, i.ease_to_build, i.uses_ai, i.ai_complexity)
+    FROM batch
+    WHERE i.id = batch.id
+      AND i.score IS DISTINCT FROM idea_score(i.scalability, i.ease_to_build, i.uses_ai, i.ai_complexity)
+    RETURNING 1
+)
+SELECT (SELECT id FROM batch ORDER BY id DESC LIMIT 1) AS last_id,
+       (SELECT count(*) FROM batch) AS scanned,
+       (SELECT count(*) FROM upd) AS updated
+""")
+
+async def rescore_all(db: AsyncSession, *, batch_size: int = 5000) -> tuple[int, int]:
+    """Recompute every stored score with the current weights; returns (scanned, updated).
+
+    Each batch commits on its own so locks stay short on large tables.
+    """
+    await db.execute(sa.text(score_function_sql()))
+    await db.commit()
+
+    after: UUID | None = None
+    scanned = updated = 0
+    while True:
+        row = (await db.execute(_RESCORE_BATCH_SQL, {"after": after, "batch_size": batch_size})).one()
+        await db.commit()
+        scanned += row.scanned
+        updated += row.updated
+        if row.last_id is None or row.scanned < batch_size:
+            return scanned, updated
+        after = row.last_id
+
+# ---------------- per-owner stats (idea_stats, maintained by triggers) ----------------
+async def get_stats(db: AsyncSession, *, owner_id: UUID) -> IdeaStats | None:
+    """Primary-key read of the owner's aggregates; None if they never had ideas."""
+    return await db.get(IdeaStats, owner_id)
+
+_STATS_HISTOGRAM_SQL = "ARRAY[" + ", ".join(
+    f"(count(*) FILTER (WHERE {STATS_BUCKET_SQL.format(score='score')} = {i}))::int" for i in range(1, STATS_BUCKETS + 1)
+) + "]"
+
+_REBUILD_STATS_SQL = sa.text(f"""
+INSERT INTO idea_stats (owner_id, idea_count, ai_count, score_sum, max_score, histogram, updated_at)
+SELECT owner_id, count(*), count(*) FILTER (WHERE uses_ai), sum(score), max(score), {_STATS_HISTOGRAM_SQL}, now()
+FROM ideas
+WHERE owner_id IS NOT NULL AND (CAST(:owner_id AS uuid) IS NULL OR owner_id = :owner_id)
+GROUP BY owner_id
+""")
+
+async def rebuild_stats(db: AsyncSession, *, owner_id: UUID | None = None) -> int:
+    """Recompute idea_stats from ideas (all owners, or one); returns rows written.
+
+    Drift repair only: the triggers keep the table current. Writes to ideas
+    are blocked (SHARE lock) until the rebuild commits.
+    """
+    await db.execute(sa.text("LOCK TABLE ideas IN SHARE MODE"))
+    clear = delete(IdeaStats)
+    if owner_id is not None:
+        clear = clear.where(IdeaStats.owner_id == owner_id)
+    await db.execute(clear)
+    result = await db.execute(_REBUILD_STATS_SQL, {"owner_id": owner_id})
     await db.commit()
-    await db.refresh(obj)
-    await db.refresh(obj, attribute_names=["owner"])
-    return obj
\ No newline at end of file
+    return result.rowcount
@@ -0,0 +1,104 @@
+"""Pagination helpers shared by paginated list endpoints.
+
+Keyset cursors capture the sort column, direction, the last row's sort key
+and its id (the tie-breaker), so the next page can seek straight to
+``(sort_key, id) < (last_key, last_id)`` instead of skipping rows with OFFSET.
+
+Count strategies decide what ``total`` costs: an exact count, the planner's
+row estimate, or nothing (clients use ``has_more``).
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+__all__ = ["encode_cursor", "decode_cursor", "decode_cursor_for", "CountMode", "estimate_count"]
+
+
+class CountMode(str, Enum):
+    exact = "exact"        # true total (folded into the page query where possible)
+    estimate = "estimate"  # planner row estimate, no scan
+    none = "none"          # no total; rely on has_more
+
+
+def encode_cursor(sort: str, order: str, key: datetime | float, last_id: UUID) -> str:
+    """Pack the position after ``(key, last_id)`` into a URL-safe token."""
+    if isinstance(key, datetime):
+        kind, value = "dt", key.isoformat()
+    else:
+        kind, value = "f", float(key)
+    payload = {"s": sort, "o": order, "t": kind, "k": value, "id": str(last_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(token: str) -> tuple[str, str, datetime | float, UUID]:
+    """Return ``(sort, order, key, last_id)``; raise ValueError on a bad token."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        kind, value = payload["t"], payload["k"]
+        if kind == "dt":
+            key: datetime | float = datetime.fromisoformat(value)
+        elif kind == "f":
+            key = float(value)
+        else:
+            raise ValueError(f"unknown cursor key type {kind!r}")
+        return payload["s"], payload["o"], key, UUID(payload["id"])
+    except (KeyError, TypeError, ValueError) as exc:  # also covers bad base64/JSON/UUID
+        raise ValueError("Invalid cursor") from exc
+
+
+# Key type each sort's cursors carry (datetimes are timezone-aware)
+_SORT_KEY_TYPES: dict[str, type] = {"created_at": datetime, "updated_at": datetime, "score": float, "relevance": float}
+
+
+def decode_cursor_for(token: str, sort: str, order: str) -> tuple[datetime | float, UUID]:
+    """Return ``(key, last_id)`` of a cursor issued for this ``sort``/``order``.
+
+    Raises ValueError if the cursor is malformed, was made for another
+    sort/order, or carries a key of the wrong type for ``sort`` (which would
+    otherwise reach the database or a comparison as a 500).
+    """
+    c_sort, c_order, key, last_id = decode_cursor(token)
+    if (c_sort, c_order) != (sort, order):
+        raise ValueError("Cursor does not match sort/order")
+    expected = _SORT_KEY_TYPES.get(sort)
+    if expected is None or not isinstance(key, expected) or (expected is datetime and key.tzinfo is None):
+        raise ValueError("Invalid cursor")
+    return key, last_id
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <stmt>`` keeping the statement's bind params."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_count(db: AsyncSession, stmt) -> int:
+    """Return the planner's row estimate for ``stmt`` without executing it.
+
+    Accuracy follows table statistics (ANALYZE/autovacuum); good enough for
+    "about N results" and page counts, never for correctness decisions.
+    """
+    plan = (await db.execute(_Explain(stmt))).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
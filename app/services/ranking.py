@@ -0,0 +1,93 @@
+"""What-if ranking: re-score an owner's ideas under caller-supplied weights.
+
+The owner's four score inputs are fetched as one row of Postgres arrays
+(``array_agg(... ORDER BY id)`` per column, so the arrays line up), turned
+into small NumPy vectors and scored in a single vectorised pass that
+mirrors ``idea_score()`` (see ``app.models.idea.SCORE_FUNCTION_SQL``).
+Top-K uses ``partition``, so the cost is O(n) in the owner's idea count
+with no per-row Python.
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.idea import Idea
+
+__all__ = ["WEIGHT_NAMES", "default_weights", "score_vector", "top_k", "rank_ideas"]
+
+# Same order/meaning as the SCORE_W_* settings
+WEIGHT_NAMES = ("scalability", "ease", "ai_flag", "ai_complex")
+
+
+def default_weights() -> dict[str, float]:
+    return {
+        "scalability": float(settings.SCORE_W_SCALABILITY),
+        "ease": float(settings.SCORE_W_EASE),
+        "ai_flag": float(settings.SCORE_W_AI_FLAG),
+        "ai_complex": float(settings.SCORE_W_AI_COMPLEX),
+    }
+
+
+def score_vector(weights: dict[str, float], scalability, ease_to_build, uses_ai, ai_complexity) -> np.ndarray:
+    """Vectorised ``idea_score()``: all inputs are equal-length arrays."""
+    scores = weights["scalability"] * ((scalability - 1) / 4.0)
+    scores += weights["ease"] * ((ease_to_build - 1) / 4.0)
+    scores += weights["ai_flag"] * uses_ai
+    scores += weights["ai_complex"] * (ai_complexity / 5.0)
+    scores *= 5.0
+    return scores
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, best first (ties keep input order)."""
+    n = scores.shape[0]
+    if n == 0 or k <= 0:
+        return np.empty(0, dtype=np.intp)
+    k = min(k, n)
+    if k < n:
+        # argpartition picks arbitrarily among scores tied with the k-th best;
+        # take everything above it, then the earliest ties, like a full sort
+        kth = -np.partition(-scores, k - 1)[k - 1]
+        above = np.flatnonzero(scores > kth)
+        part = np.concatenate((above, np.flatnonzero(scores == kth)[:k - above.size]))
+    else:
+        part = np.arange(n)
+    # stable sort by (-score, position) so equal scores rank deterministically
+    return part[np.lexsort((part, -scores[part]))]
+
+
+async def rank_ideas(
+    db: AsyncSession,
+    *,
+    owner_id: UUID,
+    weights: dict[str, float],
+    k: int,
+    uses_ai: bool | None = None,
+) -> tuple[list[tuple[UUID, float]], int]:
+    """Return ``([(idea_id, what_if_score), ...] best first, considered)``."""
+    stmt = select(
+        *(func.array_agg(aggregate_order_by(col, Idea.id))
+          for col in (Idea.id, Idea.scalability, Idea.ease_to_build, Idea.uses_ai, Idea.ai_complexity)),
+    ).where(Idea.owner_id == owner_id)
+    if uses_ai is not None:
+        stmt = stmt.where(Idea.uses_ai.is_(uses_ai))
+    ids, scal, ease, ai, cx = (await db.execute(stmt)).one()
+    if not ids:
+        return [], 0
+
+    scores = score_vector(
+        weights,
+        np.asarray(scal, dtype=np.float64),
+        np.asarray(ease, dtype=np.float64),
+        np.asarray(ai, dtype=np.float64),
+        np.asarray(cx, dtype=np.float64),
+    )
+    best = top_k(scores, k)
+    return [(ids[i], float(scores[i])) for i in best.tolist()], len(ids)
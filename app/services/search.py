@@ -0,0 +1,31 @@
+"""Search helpers shared by the ideas and users services.
+
+Substring (ILIKE) and fuzzy (``%``) predicates are both served by the
+``gin_trgm_ops`` indexes from the pg_trgm extension.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ["like_pattern", "set_similarity_threshold", "DEFAULT_SIMILARITY"]
+
+DEFAULT_SIMILARITY = 0.3  # pg_trgm's own default for the % operator
+
+
+def like_pattern(q: str) -> str:
+    """Return ``%q%`` with LIKE wildcards in ``q`` escaped (use ``escape='\\\\'``)."""
+    escaped = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+async def set_similarity_threshold(db: AsyncSession, threshold: float) -> None:
+    """Set the ``%`` operator threshold for the rest of the current transaction.
+
+    The operator (unlike ``similarity(a, b) >= t``) can use a trigram index.
+    """
+    await db.execute(
+        sa.text("SELECT set_config('pg_trgm.similarity_threshold', :t, true)"),
+        {"t": str(threshold)},
+    )
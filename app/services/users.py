@@ -5,10 +5,14 @@ from app.models.email_verification import EmailVerificationToken
 from app.services.email import send_email
 from app.core.config import settings
 from app.core.tokens import hash_token
+from app.services.search import like_pattern, set_similarity_threshold, DEFAULT_SIMILARITY
+from app.services.pagination import estimate_count
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, update
+from sqlalchemy.orm import make_transient_to_detached
 import sqlalchemy as sa
+from app.core.cache import TTLCache, WriteVersions
 from app.models.user import User
 from app.core.security import get_password_hash, verify_password
 from typing import Sequence
@@ -40,48 +44,104 @@ async def list_users(
     offset: int = 0,
     q: str | None = None,
     is_active: bool | None = None,
-) -> tuple[list[User], int]:
+    fuzzy: bool = False,
+    similarity: float = DEFAULT_SIMILARITY,
+    count: str = "exact",  # "exact" | "estimate" | "none"
+) -> tuple[list[User], int | None, bool]:
+    """Return ``(rows, total, has_more)``; ``total`` follows the ``count`` strategy."""
     filters = []
+    order_by = [User.created_at.desc()]
     if q:
-        like = f"%{q.lower()}%"
-        filters.append(sa.or_(User.email.ilike(like), User.full_name.ilike(like)))
+        like = like_pattern(q.lower())
+        matches = [User.email.ilike(like, escape="\\"), User.full_name.ilike(like, escape="\\")]
+        if fuzzy:
+            # typo-tolerant; best matches first (trigram indexes serve both forms)
+            await set_similarity_threshold(db, similarity)
+            matches += [User.email.op("%")(q), User.full_name.op("%")(q)]
+            order_by.insert(0, func.greatest(func.similarity(User.email, q), func.similarity(User.full_name, q)).desc())
+        filters.append(sa.or_(*matches))
     if is_active is not None:
         filters.append(User.is_active.is_(is_active))
 
-    stmt = select(User).where(*filters).order_by(User.created_at.desc()).limit(limit).offset(offset)
-    rows = (await db.execute(stmt)).scalars().all()
+    columns = [User]
+    if count == "exact":
+        columns.append(func.count().over().label("full_count"))  # total in the same round trip
 
-    count_stmt = select(func.count()).select_from(select(User.id).where(*filters).subquery())
-    total = (await db.execute(count_stmt)).scalar_one()
+    # one extra row tells whether another page follows
+    stmt = select(*columns).where(*filters).order_by(*order_by).limit(limit + 1).offset(offset)
+    result = (await db.execute(stmt)).all()
+    rows = [row[0] for row in result[:limit]]
+    has_more = len(result) > limit
 
-    return rows, total
+    total = None
+    if count == "exact" and result:
+        total = result[0].full_count
+    elif count == "exact":
+        count_stmt = select(func.count()).select_from(select(User.id).where(*filters).subquery())
+        total = (await db.execute(count_stmt)).scalar_one() if offset else 0
+    elif count == "estimate":
+        total = await estimate_count(db, select(User.id).where(*filters))
+
+    return rows, total, has_more
 
 async def get_user_by_id(db: AsyncSession, user_id: UUID) -> User | None:
     res = await db.execute(select(User).where(User.id == user_id))
     return res.scalar_one_or_none()
 
+# ---------------- current-user cache ----------------
+# Column snapshots of recently authenticated users, keyed by (id, write
+# version): invalidate_user() bumps the version, so a request that loaded the
+# row before a concurrent write can only store it under the old, unreachable
+# key. The TTL bounds staleness from writes made outside this process.
+_USER_COLUMNS = tuple(attr.key for attr in sa.inspect(User).column_attrs)
+_user_cache = TTLCache("users", maxsize=settings.USER_CACHE_MAX, ttl=settings.USER_CACHE_TTL_SECONDS)
+_user_versions = WriteVersions()
+
+def invalidate_user(user_id: UUID) -> None:
+    """Call after committing any change to a user row."""
+    _user_cache.pop((user_id, _user_versions.get(user_id)))
+    _user_versions.bump(user_id)
+
+async def get_user_cached(db: AsyncSession, user_id: UUID) -> User | None:
+    """get_user_by_id, served from the cache when possible.
+
+    A hit is rebuilt as a detached instance and merged into ``db`` without a
+    SELECT, so it behaves like a loaded row (identity map, later updates).
+    """
+    key = (user_id, _user_versions.get(user_id))
+    snapshot = _user_cache.get(key)
+    if snapshot is None:
+        user = await get_user_by_id(db, user_id)
+        if user is not None:
+            _user_cache.set(key, {name: getattr(user, name) for name in _USER_COLUMNS})
+        return user
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
 async def update_user_admin(db: AsyncSession, user_id: UUID, data: dict) -> User | None:
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return None
-    for k, v in data.items():
-        if v is not None:
-            setattr(user, k, v)
+    values = {k: v for k, v in data.items() if v is not None}
+    if not values:
+        return await get_user_by_id(db, user_id)
+    stmt = update(User).where(User.id == user_id).values(**values).returning(User)
+    user = (await db.scalars(stmt)).one_or_none()
     await db.commit()
-    await db.refresh(user)
+    invalidate_user(user_id)
     return user
 
 async def delete_user(db: AsyncSession, user_id: UUID) -> bool:
-    user = await get_user_by_id(db, user_id)
-    if not user:
-        return False
-    await db.delete(user)
+    # ideas.owner_id is ON DELETE SET NULL and token tables CASCADE in the DB,
+    # so a single DELETE replaces the ORM load-and-cascade
+    stmt = sa.delete(User).where(User.id == user_id).returning(User.id)
+    deleted = (await db.scalars(stmt)).one_or_none()
     await db.commit()
-    return True
+    invalidate_user(user_id)
+    return deleted is not None
 
 async def set_user_password(db: AsyncSession, user: User, new_password: str) -> User:
     user.hashed_password = get_password_hash(new_password)
     await db.commit()
+    invalidate_user(user.id)
     await db.refresh(user)
     return user
 
@@ -89,6 +149,7 @@ async def update_profile(db: AsyncSession, user: User, *, full_name: str | None
     if full_name is not None:
         user.full_name = full_name
     await db.commit()
+    invalidate_user(user.id)
     await db.refresh(user)
     return user
 
@@ -102,6 +163,7 @@ async def change_password(
         return False
     user.hashed_password = get_password_hash(new_password)
     await db.commit()
+    invalidate_user(user.id)
     return True
 
 
@@ -143,6 +205,7 @@ async def reset_password_with_token(db: AsyncSession, *, token: str, new_passwor
     user.hashed_password = get_password_hash(new_password)
     prt.used_at = now
     await db.commit()
+    invalidate_user(user.id)
     return True
 
     
@@ -198,6 +261,7 @@ async def verify_email_with_token(db: AsyncSession, token_raw: str) -> bool:
     user.is_verified = True
     evt.used_at = now
     await db.commit()
+    invalidate_user(user.id)
     return True
 
 async def send_password_reset_email(db: AsyncSession, *, email: str, ttl_minutes: int = 30) -> None:
@@ -15,6 +15,9 @@ from app.models.user import User
 from app.models.idea import Idea
 from app.models.password_reset import PasswordResetToken 
 from app.models.email_verification import EmailVerificationToken
+from app.models.tag import TagRegistry
+from app.models.idea_stats import IdeaStats
+from app.models.idea_lsh import IdeaLshBucket
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
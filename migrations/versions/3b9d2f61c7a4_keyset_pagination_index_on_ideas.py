@@ -0,0 +1,31 @@
+"""keyset pagination index on ideas
+
+Revision ID: 3b9d2f61c7a4
+Revises: 142fc07b3483
+Create Date: 2026-10-17 09:12:04.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2f61c7a4'
+down_revision: Union[str, Sequence[str], None] = '142fc07b3483'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Seek index for GET /ideas?cursor=... sorted by created_at (id breaks ties)
+    op.create_index(
+        "ix_ideas_owner_created_at_id", "ideas", ["owner_id", "created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ideas_owner_created_at_id", table_name="ideas")
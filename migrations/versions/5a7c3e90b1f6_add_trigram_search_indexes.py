@@ -0,0 +1,44 @@
+"""add trigram search indexes
+
+Revision ID: 5a7c3e90b1f6
+Revises: c4f07e2d9b18
+Create Date: 2026-10-17 12:41:18.662390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7c3e90b1f6'
+down_revision: Union[str, Sequence[str], None] = 'c4f07e2d9b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    # GIN trigram indexes serve both ILIKE '%q%' and the fuzzy % operator
+    op.create_index(
+        "ix_ideas_title_trgm", "ideas", ["title"], unique=False,
+        postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_email_trgm", "users", ["email"], unique=False,
+        postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_users_full_name_trgm", "users", ["full_name"], unique=False,
+        postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_full_name_trgm", table_name="users")
+    op.drop_index("ix_users_email_trgm", table_name="users")
+    op.drop_index("ix_ideas_title_trgm", table_name="ideas")
+    # pg_trgm is left installed; other objects may depend on it
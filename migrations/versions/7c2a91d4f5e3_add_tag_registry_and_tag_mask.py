@@ -0,0 +1,75 @@
+"""add tag registry and tag mask
+
+Revision ID: 7c2a91d4f5e3
+Revises: d19e6b40a8c3
+Create Date: 2026-10-17 15:21:47.530912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2a91d4f5e3'
+down_revision: Union[str, Sequence[str], None] = 'd19e6b40a8c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Registry version 1 (bit = position); later versions append in new migrations
+TAGS_V1 = (
+    "web", "mobile", "ai", "ml", "iot", "blockchain", "arvr", "health", "education",
+    "finance", "entertainment", "social", "ecommerce", "productivity", "gaming",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    registry = op.create_table(
+        "tag_registry",
+        sa.Column("slug", sa.String(length=30), nullable=False),
+        sa.Column("bit", sa.SmallInteger(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.CheckConstraint("bit >= 0 AND bit < 31", name="ck_tag_registry_bit_range"),
+        sa.PrimaryKeyConstraint("slug"),
+        sa.UniqueConstraint("bit"),
+    )
+    op.bulk_insert(registry, [{"slug": slug, "bit": bit, "version": 1} for bit, slug in enumerate(TAGS_V1)])
+
+    op.add_column(
+        "ideas",
+        sa.Column("tag_mask", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    op.execute("""
+    CREATE OR REPLACE FUNCTION ideas_set_tag_mask() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.tag_mask := COALESCE((SELECT bit_or(1 << bit) FROM tag_registry WHERE slug = ANY(NEW.tags)), 0);
+        RETURN NEW;
+    END
+    $$;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_ideas_set_tag_mask
+    BEFORE INSERT OR UPDATE OF tags ON ideas
+    FOR EACH ROW EXECUTE FUNCTION ideas_set_tag_mask();
+    """)
+
+    # Backfill existing rows
+    op.execute("""
+    UPDATE ideas SET tag_mask = COALESCE((SELECT bit_or(1 << r.bit) FROM tag_registry r WHERE r.slug = ANY(ideas.tags)), 0)
+    WHERE tags <> '{}';
+    """)
+
+    # Tag filters are bitwise on tag_mask now; the array's GIN index only costs writes
+    op.drop_index("ix_ideas_tags_gin", table_name="ideas")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_ideas_tags_gin", "ideas", ["tags"], unique=False, postgresql_using="gin")
+    op.execute("DROP TRIGGER IF EXISTS trg_ideas_set_tag_mask ON ideas;")
+    op.execute("DROP FUNCTION IF EXISTS ideas_set_tag_mask();")
+    op.drop_column("ideas", "tag_mask")
+    op.drop_table("tag_registry")
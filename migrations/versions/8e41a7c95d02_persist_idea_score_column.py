@@ -0,0 +1,75 @@
+"""persist idea score column
+
+Revision ID: 8e41a7c95d02
+Revises: 3b9d2f61c7a4
+Create Date: 2026-10-17 10:03:41.207755
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41a7c95d02'
+down_revision: Union[str, Sequence[str], None] = '3b9d2f61c7a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ideas",
+        sa.Column("score", sa.Float(), nullable=False, server_default=sa.text("0")),
+    )
+
+    # Weights are baked into the function; app.scripts.rescore replaces it later.
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION idea_score(scalability integer, ease_to_build integer, uses_ai boolean, ai_complexity integer)
+    RETURNS double precision
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT (
+            {float(settings.SCORE_W_SCALABILITY)} * ((scalability - 1) / 4.0)
+            + {float(settings.SCORE_W_EASE)} * ((ease_to_build - 1) / 4.0)
+            + {float(settings.SCORE_W_AI_FLAG)} * (CASE WHEN uses_ai THEN 1.0 ELSE 0.0 END)
+            + {float(settings.SCORE_W_AI_COMPLEX)} * (ai_complexity / 5.0)
+        )::double precision * 5.0
+    $$;
+    """)
+    op.execute("""
+    CREATE OR REPLACE FUNCTION ideas_set_score() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.score := idea_score(NEW.scalability, NEW.ease_to_build, NEW.uses_ai, NEW.ai_complexity);
+        RETURN NEW;
+    END
+    $$;
+    """)
+    op.execute("""
+    CREATE TRIGGER trg_ideas_set_score
+    BEFORE INSERT OR UPDATE OF scalability, ease_to_build, uses_ai, ai_complexity ON ideas
+    FOR EACH ROW EXECUTE FUNCTION ideas_set_score();
+    """)
+
+    # Backfill existing rows
+    op.execute("UPDATE ideas SET score = idea_score(scalability, ease_to_build, uses_ai, ai_complexity);")
+
+    op.create_index(
+        "ix_ideas_owner_score_id",
+        "ideas",
+        ["owner_id", sa.text("score DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ideas_owner_score_id", table_name="ideas")
+    op.execute("DROP TRIGGER IF EXISTS trg_ideas_set_score ON ideas;")
+    op.execute("DROP FUNCTION IF EXISTS ideas_set_score();")
+    op.execute("DROP FUNCTION IF EXISTS idea_score(integer, integer, boolean, integer);")
+    op.drop_column("ideas", "score")
@@ -0,0 +1,129 @@
+"""add idea stats table and triggers
+
+Revision ID: b58e0c3f1a27
+Revises: 7c2a91d4f5e3
+Create Date: 2026-10-17 16:48:09.317604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58e0c3f1a27'
+down_revision: Union[str, Sequence[str], None] = '7c2a91d4f5e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BUCKETS = 10
+BUCKET = "least(greatest(width_bucket(score, 0.0, 5.0, 10), 1), 10)"
+HISTOGRAM_SUM = "ARRAY[" + ", ".join(
+    f"coalesce(sum(sign) FILTER (WHERE bucket = {i}), 0)::int" for i in range(1, BUCKETS + 1)
+) + "]"
+
+# {rows}: SELECT owner_id, sign (+1 added / -1 removed), score, uses_ai
+APPLY_DELTAS = f"""
+    WITH d AS (
+        SELECT owner_id, sign, score, uses_ai, {BUCKET} AS bucket
+        FROM ({{rows}}) AS r(owner_id, sign, score, uses_ai)
+        WHERE owner_id IS NOT NULL
+    ), agg AS (
+        SELECT owner_id,
+               sum(sign)::int AS idea_count,
+               coalesce(sum(sign) FILTER (WHERE uses_ai), 0)::int AS ai_count,
+               sum(sign * score) AS score_sum,
+               max(score) FILTER (WHERE sign > 0) AS max_score,
+               {HISTOGRAM_SUM} AS histogram
+        FROM d GROUP BY owner_id
+    )
+    INSERT INTO idea_stats AS s (owner_id, idea_count, ai_count, score_sum, max_score, histogram, updated_at)
+    SELECT owner_id, idea_count, ai_count, score_sum, max_score, histogram, now() FROM agg
+    ON CONFLICT (owner_id) DO UPDATE SET
+        idea_count = s.idea_count + EXCLUDED.idea_count,
+        ai_count = s.ai_count + EXCLUDED.ai_count,
+        score_sum = s.score_sum + EXCLUDED.score_sum,
+        max_score = greatest(s.max_score, EXCLUDED.max_score),
+        histogram = ARRAY(SELECT a + b FROM unnest(s.histogram, EXCLUDED.histogram) AS h(a, b)),
+        updated_at = now();
+"""
+
+# A removed row that held the max: re-read it via ix_ideas_owner_score_id
+RESCAN_MAX = """
+    UPDATE idea_stats s
+    SET max_score = (SELECT max(i.score) FROM ideas i WHERE i.owner_id = s.owner_id)
+    FROM (SELECT owner_id, max(score) AS removed FROM old_rows GROUP BY owner_id) r
+    WHERE s.owner_id = r.owner_id AND r.removed >= s.max_score;
+"""
+
+INSERT_ROWS = "SELECT owner_id, 1, score, uses_ai FROM new_rows"
+DELETE_ROWS = "SELECT owner_id, -1, score, uses_ai FROM old_rows"
+# only rows whose owner, score or AI flag changed; title/description edits cancel out
+UPDATE_ROWS = """
+    SELECT o.owner_id, -1, o.score, o.uses_ai FROM old_rows o JOIN new_rows n ON n.id = o.id
+    WHERE (o.owner_id, o.score, o.uses_ai) IS DISTINCT FROM (n.owner_id, n.score, n.uses_ai)
+    UNION ALL
+    SELECT n.owner_id, 1, n.score, n.uses_ai FROM old_rows o JOIN new_rows n ON n.id = o.id
+    WHERE (o.owner_id, o.score, o.uses_ai) IS DISTINCT FROM (n.owner_id, n.score, n.uses_ai)
+"""
+
+# (function/trigger suffix, event, transition tables, delta rows, rescan max?)
+TRIGGERS = (
+    ("ins", "INSERT", "NEW TABLE AS new_rows", INSERT_ROWS, False),
+    ("upd", "UPDATE", "OLD TABLE AS old_rows NEW TABLE AS new_rows", UPDATE_ROWS, True),
+    ("del", "DELETE", "OLD TABLE AS old_rows", DELETE_ROWS, True),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "idea_stats",
+        sa.Column("owner_id", sa.UUID(), nullable=False),
+        sa.Column("idea_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("ai_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default=sa.text("0")),
+        sa.Column("max_score", sa.Float(), nullable=True),
+        sa.Column("histogram", postgresql.ARRAY(sa.Integer()), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("owner_id"),
+    )
+
+    # Statement-level triggers with transition tables: one aggregate upsert per
+    # statement, however many rows it touched (batch/import included)
+    for suffix, event, tables, rows, rescan in TRIGGERS:
+        op.execute(f"""
+        CREATE OR REPLACE FUNCTION ideas_stats_{suffix}() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            {APPLY_DELTAS.format(rows=rows)}
+            {RESCAN_MAX if rescan else ""}
+            RETURN NULL;
+        END
+        $$;
+        """)
+        op.execute(f"""
+        CREATE TRIGGER trg_ideas_stats_{suffix}
+        AFTER {event} ON ideas
+        REFERENCING {tables}
+        FOR EACH STATEMENT EXECUTE FUNCTION ideas_stats_{suffix}();
+        """)
+
+    # Backfill
+    op.execute(f"""
+    INSERT INTO idea_stats (owner_id, idea_count, ai_count, score_sum, max_score, histogram, updated_at)
+    SELECT owner_id, count(*), count(*) FILTER (WHERE uses_ai), sum(score), max(score),
+           {HISTOGRAM_SUM.replace("sum(sign)", "count(*)")}, now()
+    FROM (SELECT owner_id, score, uses_ai, {BUCKET} AS bucket FROM ideas WHERE owner_id IS NOT NULL) i
+    GROUP BY owner_id;
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for suffix, *_ in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_ideas_stats_{suffix} ON ideas;")
+        op.execute(f"DROP FUNCTION IF EXISTS ideas_stats_{suffix}();")
+    op.drop_table("idea_stats")
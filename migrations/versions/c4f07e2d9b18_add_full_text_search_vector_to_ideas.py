@@ -0,0 +1,44 @@
+"""add full-text search vector to ideas
+
+Revision ID: c4f07e2d9b18
+Revises: 8e41a7c95d02
+Create Date: 2026-10-17 11:20:57.931046
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql as pg
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f07e2d9b18'
+down_revision: Union[str, Sequence[str], None] = '8e41a7c95d02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: title weighted A, description weighted B
+    op.add_column(
+        "ideas",
+        sa.Column(
+            "search_vector",
+            pg.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_ideas_search_vector_gin", "ideas", ["search_vector"], unique=False, postgresql_using="gin")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_ideas_search_vector_gin", table_name="ideas")
+    op.drop_column("ideas", "search_vector")
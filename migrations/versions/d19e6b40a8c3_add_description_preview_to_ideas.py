@@ -0,0 +1,37 @@
+"""add description preview to ideas
+
+Revision ID: d19e6b40a8c3
+Revises: 5a7c3e90b1f6
+Create Date: 2026-10-17 13:58:02.114729
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd19e6b40a8c3'
+down_revision: Union[str, Sequence[str], None] = '5a7c3e90b1f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored generated column: list views read this instead of the full description
+    op.add_column(
+        "ideas",
+        sa.Column(
+            "description_preview",
+            sa.String(length=280),
+            sa.Computed("left(description, 280)", persisted=True),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ideas", "description_preview")
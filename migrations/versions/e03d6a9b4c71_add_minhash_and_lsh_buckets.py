@@ -0,0 +1,41 @@
+"""add minhash and lsh buckets
+
+Revision ID: e03d6a9b4c71
+Revises: b58e0c3f1a27
+Create Date: 2026-10-17 18:05:33.608215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e03d6a9b4c71'
+down_revision: Union[str, Sequence[str], None] = 'b58e0c3f1a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Signatures are computed in Python: run app.scripts.backfill_minhash after upgrading
+    op.add_column("ideas", sa.Column("minhash", sa.LargeBinary(), nullable=True))
+    op.create_table(
+        "idea_lsh_buckets",
+        sa.Column("owner_id", sa.UUID(), nullable=False),
+        sa.Column("band", sa.SmallInteger(), nullable=False),
+        sa.Column("bucket", sa.BigInteger(), nullable=False),
+        sa.Column("idea_id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["idea_id"], ["ideas.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("owner_id", "band", "bucket", "idea_id"),
+    )
+    op.create_index("ix_idea_lsh_buckets_idea_id", "idea_lsh_buckets", ["idea_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_idea_lsh_buckets_idea_id", table_name="idea_lsh_buckets")
+    op.drop_table("idea_lsh_buckets")
+    op.drop_column("ideas", "minhash")
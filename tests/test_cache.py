@@ -0,0 +1,49 @@
+import uuid
+from app.core.cache import WriteVersions
+from app.services import idea_cache as idea_cache_module
+from app.services.idea_cache import IdeaCache
+
+
+def test_write_versions_change_on_bump():
+    versions = WriteVersions(maxsize=10)
+    before = versions.get("a")
+    versions.bump("a")
+    after = versions.get("a")
+    assert after != before
+    versions.bump("a")
+    assert versions.get("a") not in (before, after)
+
+
+def test_write_versions_bounded_and_never_reused():
+    versions = WriteVersions(maxsize=3)
+    seen = {key: {versions.get(key)} for key in range(10)}
+    for _ in range(5):
+        for key in range(10):
+            versions.bump(key)
+            assert len(versions._versions) <= 3
+            # a bump never hands a key a version it was given before
+            assert versions.get(key) not in seen[key]
+            for k in range(10):
+                seen[k].add(versions.get(k))
+
+
+def test_evicted_key_misses_old_entries():
+    versions = WriteVersions(maxsize=2)
+    untracked = versions.get("z")
+    versions.bump("a")
+    cached_under = versions.get("a")
+    versions.bump("b")
+    versions.bump("c")  # evicts "a"
+    assert "a" not in versions._versions
+    assert versions.get("a") not in (cached_under, untracked)
+    assert versions.get("z") != untracked
+
+
+def test_oversized_owners_bounded(monkeypatch):
+    monkeypatch.setattr(idea_cache_module, "_OVERSIZED_MAX", 4)
+    cache = IdeaCache(enabled=True, max_bytes=1024, max_rows=10, ttl=60)
+    owners = [uuid.uuid4() for _ in range(10)]
+    for owner in owners:
+        cache._mark_oversized(owner, "v")
+    assert list(cache._oversized) == owners[-4:]
+    assert cache.stats()["oversized_owners"] == 4
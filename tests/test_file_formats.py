@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from app.services.file_formats import read_csv, read_ndjson, RowSpool
+
+
+def _parse(reader, data: bytes, chunk_size: int = 7) -> list:
+    async def chunks():
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
+    async def collect():
+        return [record async for record in reader(chunks())]
+
+    return asyncio.run(collect())
+
+
+def test_csv_rows_and_tags():
+    data = "\ufefftitle,description,tags\nA,first,ai;web\nB,\"multi\nline, quoted\",\n".encode("utf-8")
+    assert _parse(read_csv, data) == [
+        (2, {"title": "A", "description": "first", "tags": ["ai", "web"]}, None),
+        (3, {"title": "B", "description": "multi\nline, quoted", "tags": []}, None),
+    ]
+
+
+def test_csv_column_count_mismatch_reports_line():
+    data = b"title,description\nA,ok\nB,too,many\nC\n\nD,fine\n"
+    records = _parse(read_csv, data)
+    assert records == [
+        (2, {"title": "A", "description": "ok"}, None),
+        (3, None, "Expected 2 columns, got 3"),
+        (4, None, "Expected 2 columns, got 1"),
+        (6, {"title": "D", "description": "fine"}, None),
+    ]
+
+
+def test_csv_header_only_and_unterminated_quote():
+    assert _parse(read_csv, b"title,description\n") == []
+    assert _parse(read_csv, b'title,description\nA,"never closed\nmore\n') == [(2, None, "Unterminated quoted field")]
+
+
+def test_ndjson_bad_rows_keep_going():
+    data = b'{"title": "A"}\n\nnot json\n[1, 2]\n{"title": "B"}'
+    records = _parse(read_ndjson, data, chunk_size=5)
+    assert [(line, row) for line, row, _ in records] == [(1, {"title": "A"}), (3, None), (4, None), (5, {"title": "B"})]
+    assert records[1][2].startswith("Invalid JSON")
+    assert records[2][2] == "Expected a JSON object"
+
+
+def test_ndjson_keeps_unicode_line_separators():
+    data = '{"description": "a\u2028b"}\n'.encode("utf-8")
+    assert _parse(read_ndjson, data, chunk_size=3) == [(1, {"description": "a\u2028b"}, None)]
+
+
+@pytest.mark.parametrize("max_memory", [0, 1 << 20])
+def test_row_spool_round_trip(max_memory):
+    rows = [{"title": f"T{i}", "tags": ["ai"] if i % 2 else [], "uses_ai": bool(i % 2)} for i in range(11)]
+    with RowSpool(max_memory=max_memory) as spool:
+        for row in rows:
+            spool.append(row)
+        assert spool.rows == 11
+        chunks = list(spool.chunks(4))
+    assert [len(c) for c in chunks] == [4, 4, 3]
+    assert [row for chunk in chunks for row in chunk] == rows
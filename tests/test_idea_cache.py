@@ -0,0 +1,105 @@
+import itertools
+import uuid
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.models.tag import tag_mask
+from app.services.idea_cache import OwnerIdeas
+from app.services.pagination import encode_cursor
+
+# Reference semantics are those of ideas.list_: filter, order by (key, id)
+# in the requested direction, LIMIT/OFFSET or seek past the cursor.
+
+_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_TAGS = (["ai"], ["web"], ["ai", "web"], [], ["health"])
+
+
+def _rows(n: int = 23) -> list[tuple]:
+    rows = []
+    for i in range(n):
+        tags = _TAGS[i % len(_TAGS)]
+        rows.append((
+            uuid.UUID(int=(i * 7919) % 1000 + 1),  # id order unrelated to insert order
+            f"Idea {i}", "text " * (i % 4 + 1),
+            1 + i % 5, 1 + i % 4, bool(i % 2), i % 4, tags,
+            round(1.0 + (i % 6) * 0.5, 4),              # duplicate scores
+            _BASE + timedelta(minutes=i // 3),          # duplicate timestamps
+            _BASE, tag_mask(tags),
+        ))
+    # OwnerIdeas expects (created_at, id) order, as loaded
+    return sorted(rows, key=lambda r: (r[9], r[0]))
+
+
+_ROWS = _rows()
+_ENTRY = OwnerIdeas(uuid.uuid4(), "v1", _ROWS)
+
+_FILTERS = [
+    {},
+    {"uses_ai": True},
+    {"uses_ai": False, "min_score": 2.0},
+    {"min_score": 1.5, "max_score": 3.0},
+    {"tags_any": ["ai"]},
+    {"tags_any": ["health", "web"]},
+    {"tags_all": ["ai", "web"]},
+    {"tags_all": ["ai", "unknown"]},
+    {"tags_any": ["unknown"]},
+]
+
+
+def _expected(sort: str, order: str, uses_ai=None, min_score=None, max_score=None, tags_any=None, tags_all=None):
+    col = 9 if sort == "created_at" else 8
+    rows = [
+        r for r in _ROWS
+        if (uses_ai is None or r[5] == uses_ai)
+        and (min_score is None or r[8] >= min_score)
+        and (max_score is None or r[8] <= max_score)
+        and (not tags_any or any(t in r[7] for t in tags_any))
+        and (not tags_all or all(t in r[7] for t in tags_all))
+    ]
+    rows.sort(key=lambda r: (r[col], r[0]), reverse=order == "desc")
+    return rows
+
+
+def _ids(items) -> list:
+    return [obj.id for obj in items]
+
+
+@pytest.mark.parametrize("sort, order, filters", list(itertools.product(("created_at", "score"), ("asc", "desc"), _FILTERS)))
+def test_offset_pages_match_list(sort, order, filters):
+    expected = _expected(sort, order, **filters)
+    for offset in (0, 3, len(expected)):
+        items, total, next_cursor = _ENTRY.page(limit=5, offset=offset, sort=sort, order=order, **filters)
+        window = expected[offset:offset + 5]
+        assert _ids(items) == [r[0] for r in window]
+        assert total == len(expected)
+        if len(expected) > offset + 5:
+            last = window[-1]
+            assert next_cursor == encode_cursor(sort, order, last[9] if sort == "created_at" else last[8], last[0])
+        else:
+            assert next_cursor is None
+
+
+@pytest.mark.parametrize("sort, order, filters", list(itertools.product(("created_at", "score"), ("asc", "desc"), _FILTERS)))
+def test_cursor_walk_matches_list(sort, order, filters):
+    seen, cursor = [], None
+    while True:
+        # offset is ignored once a cursor is given
+        offset = 0 if cursor is None else 99
+        items, total, cursor = _ENTRY.page(limit=4, offset=offset, sort=sort, order=order, cursor=cursor, count="none", **filters)
+        assert total is None
+        seen.extend(_ids(items))
+        if cursor is None:
+            break
+    assert seen == [r[0] for r in _expected(sort, order, **filters)]
+
+
+def test_fields_projection():
+    items, _, _ = _ENTRY.page(limit=2, offset=0, sort="score", order="desc", fields=["title", "score"])
+    top = _expected("score", "desc")[:2]
+    assert items == [{"id": r[0], "title": r[1], "score": r[8]} for r in top]
+
+
+@pytest.mark.parametrize("sort, key", [("score", _BASE), ("created_at", 1.5)])
+def test_cursor_key_kind_mismatch(sort, key):
+    cursor = encode_cursor(sort, "desc", key, _ROWS[0][0])
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        _ENTRY.page(limit=5, offset=0, sort=sort, order="desc", cursor=cursor)
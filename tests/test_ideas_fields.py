@@ -0,0 +1,36 @@
+import asyncio
+import uuid
+import orjson
+import pytest
+from app.api.routers import ideas as ideas_router
+from app.models.user import User
+
+
+def _user() -> User:
+    return User(id=uuid.uuid4(), email="owner@example.com", full_name="Owner Name")
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_fields_owner_only(monkeypatch, compact):
+    user = _user()
+    idea_id = uuid.uuid4()
+    seen = {}
+
+    async def fake_list(db, *, fields, **kwargs):
+        seen["fields"] = fields
+        return [{"id": idea_id}], 1, None
+
+    monkeypatch.setattr(ideas_router, "list_", fake_list)
+    selected = ideas_router._parse_fields("owner")
+    body = asyncio.run(ideas_router._list_body(
+        None, user, selected, ideas_router._list_columns(selected), compact=compact, cursor=None, offset=0, limit=20,
+    ))
+    page = orjson.loads(body)
+
+    assert seen["fields"] == ["id"]
+    owner = {"id": str(user.id), "full_name": user.full_name}
+    if compact:
+        assert page["items"] == [{"id": str(idea_id)}]
+        assert page["owner"] == owner
+    else:
+        assert page["items"] == [{"id": str(idea_id), "owner": owner}]
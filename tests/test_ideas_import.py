@@ -0,0 +1,82 @@
+import uuid
+import pytest
+from fastapi.testclient import TestClient
+from app.api import deps
+from app.api.routers import ideas as ideas_router
+from app.core.config import settings
+from app.main import app
+from app.models.user import User
+
+
+class _Session:
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    session = _Session()
+    imported: list[dict] = []
+
+    async def fake_import(db, chunks, *, owner_id):
+        # the upload has been fully read (and the auth connection released) by now
+        assert db.closed
+        rows = [row for chunk in chunks for row in chunk]
+        imported.extend(rows)
+        return len(rows)
+
+    async def _db():
+        yield session
+
+    user = User(id=uuid.uuid4(), email="owner@example.com", full_name="Owner", is_verified=True)
+    monkeypatch.setattr(ideas_router, "import_", fake_import)
+    app.dependency_overrides[deps.get_db] = _db
+    app.dependency_overrides[deps.get_current_user] = lambda: user
+    try:
+        yield TestClient(app), imported
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_csv_import_reports_error_rows(client):
+    http, imported = client
+    body = (
+        "title,description,scalability,ease_to_build,uses_ai,ai_complexity,tags\n"
+        "Good,desc,3,2,true,4,ai;web\n"
+        "Bad scale,desc,9,2,false,0,\n"
+        "Short,row\n"
+        "Defaults,desc,1,1,,0,\n"
+    )
+    res = http.post("/ideas/import?format=csv", content=body.encode(), headers={"Content-Type": "text/csv"})
+    assert res.status_code == 200
+    out = res.json()
+    assert (out["received"], out["imported"], out["failed"]) == (4, 2, 2)
+    assert [e["line"] for e in out["errors"]] == [3, 4]
+    assert out["errors"][0]["errors"][0]["loc"] == ["scalability"]
+    assert out["errors"][1]["errors"][0]["msg"] == "Expected 7 columns, got 2"
+    assert [row["title"] for row in imported] == ["Good", "Defaults"]
+    assert imported[1]["uses_ai"] is False and imported[1]["ai_complexity"] == 0
+
+
+def test_ndjson_import_reports_error_rows(client):
+    http, imported = client
+    body = (
+        b'{"title": "A", "description": "d", "scalability": 2, "ease_to_build": 3, "ai_complexity": 0}\n'
+        b"oops\n"
+        b'{"title": "", "description": "d", "scalability": 2, "ease_to_build": 3, "ai_complexity": 0}\n'
+    )
+    res = http.post("/ideas/import?format=ndjson", content=body)
+    out = res.json()
+    assert (out["received"], out["imported"], out["failed"]) == (3, 1, 2)
+    assert [e["line"] for e in out["errors"]] == [2, 3]
+    assert [row["title"] for row in imported] == ["A"]
+
+
+def test_import_size_cap(client, monkeypatch):
+    http, imported = client
+    monkeypatch.setattr(settings, "IMPORT_MAX_MB", 0)
+    res = http.post("/ideas/import?format=ndjson", content=b'{"title": "A"}\n')
+    assert res.status_code == 413
+    assert imported == []
@@ -0,0 +1,57 @@
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+import pytest
+from app.services.pagination import encode_cursor, decode_cursor, decode_cursor_for
+
+
+def _forge(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def test_round_trip():
+    last_id = uuid.uuid4()
+    when = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    assert decode_cursor(encode_cursor("created_at", "desc", when, last_id)) == ("created_at", "desc", when, last_id)
+    assert decode_cursor_for(encode_cursor("created_at", "desc", when, last_id), "created_at", "desc") == (when, last_id)
+    assert decode_cursor_for(encode_cursor("score", "asc", 3.25, last_id), "score", "asc") == (3.25, last_id)
+
+
+@pytest.mark.parametrize("token", [
+    "not-a-cursor",
+    "",
+    _forge({"s": "score", "o": "desc", "t": "x", "k": 1, "id": str(uuid.uuid4())}),
+    _forge({"s": "score", "o": "desc", "t": "f", "k": 1.0, "id": "nope"}),
+    _forge({"s": "score", "o": "desc", "t": "f", "id": str(uuid.uuid4())}),
+])
+def test_tampered_cursor(token):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor_for(token, "score", "desc")
+
+
+def test_tampered_base64():
+    token = encode_cursor("score", "desc", 2.0, uuid.uuid4())
+    with pytest.raises(ValueError):
+        decode_cursor_for(token[:-3] + "!!!", "score", "desc")
+
+
+@pytest.mark.parametrize("sort, kind, key", [
+    ("score", "dt", "2026-01-02T03:04:05+00:00"),
+    ("relevance", "dt", "2026-01-02T03:04:05+00:00"),
+    ("created_at", "f", 1.5),
+    ("created_at", "dt", "2026-01-02T03:04:05"),  # naive datetime
+])
+def test_key_kind_must_match_sort(sort, kind, key):
+    token = _forge({"s": sort, "o": "desc", "t": kind, "k": key, "id": str(uuid.uuid4())})
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor_for(token, sort, "desc")
+
+
+def test_sort_or_order_mismatch():
+    token = encode_cursor("score", "desc", 2.0, uuid.uuid4())
+    with pytest.raises(ValueError, match="does not match"):
+        decode_cursor_for(token, "score", "asc")
+    with pytest.raises(ValueError, match="does not match"):
+        decode_cursor_for(token, "created_at", "desc")
@@ -0,0 +1,52 @@
+import asyncio
+import uuid
+import numpy as np
+import pytest
+from app.services.ranking import rank_ideas, top_k
+
+
+def _full_sort(scores) -> list[int]:
+    # reference: best score first, ties in input (id) order
+    return sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_top_k_matches_full_sort_with_ties(seed):
+    rng = np.random.default_rng(seed)
+    scores = rng.integers(0, 5, size=int(rng.integers(1, 60))).astype(np.float64) / 2  # many duplicates
+    expected = _full_sort(scores.tolist())
+    for k in range(0, len(scores) + 2):
+        assert top_k(scores, k).tolist() == expected[:k]
+
+
+def test_top_k_edge_cases():
+    assert top_k(np.array([], dtype=np.float64), 3).tolist() == []
+    assert top_k(np.array([1.0, 1.0, 1.0]), 2).tolist() == [0, 1]
+    assert top_k(np.array([1.0, 2.0]), -1).tolist() == []
+
+
+class _Result:
+    def __init__(self, row):
+        self.row = row
+
+    def one(self):
+        return self.row
+
+
+class _Session:
+    def __init__(self, row):
+        self.row = row
+
+    async def execute(self, stmt):
+        return _Result(self.row)
+
+
+def test_rank_ideas_ties_come_back_in_id_order():
+    # the query returns arrays ordered by id; equal inputs score equally
+    ids = sorted(uuid.uuid4() for _ in range(6))
+    row = (ids, [3, 5, 3, 5, 1, 3], [2, 2, 2, 2, 2, 2], [True] * 6, [1] * 6)
+    weights = {"scalability": 0.4, "ease": 0.3, "ai_flag": 0.2, "ai_complex": 0.1}
+    ranked, considered = asyncio.run(rank_ideas(_Session(row), owner_id=uuid.uuid4(), weights=weights, k=4))
+    assert considered == 6
+    assert [iid for iid, _ in ranked] == [ids[1], ids[3], ids[0], ids[2]]
+    assert ranked[0][1] == ranked[1][1] and ranked[2][1] == ranked[3][1]
@@ -0,0 +1,69 @@
+import hashlib
+import hmac
+import time
+import pytest
+from jose import JWTError, jwt
+from app.core import security
+from app.core.config import settings
+from app.core.security import TokenClaimCache, create_access_token, decode_access_token, token_claims
+
+
+def _token(sub: str, exp: float) -> str:
+    return jwt.encode({"sub": sub, "exp": int(exp)}, settings.SECRET_KEY, algorithm=settings.ACCESS_TOKEN_ALGORITHM)
+
+
+def test_cached_claim_not_returned_after_exp(monkeypatch):
+    cache = TokenClaimCache(10)
+    now = time.time()
+    cache.set("tok", "user-1", now + 30)
+    assert cache.get("tok") == "user-1"
+    monkeypatch.setattr(security.time, "time", lambda: now + 30)
+    assert cache.get("tok") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_expired_token_rejected_even_if_cached():
+    exp = time.time() - 1
+    token = _token("user-2", exp)
+    token_claims.set(token, "user-2", exp)  # as if it was cached while still valid
+    with pytest.raises(JWTError):
+        decode_access_token(token)
+    assert token_claims.get(token) is None
+
+
+def test_modified_signature_misses_cache_and_is_rejected():
+    token = create_access_token("user-3")
+    assert decode_access_token(token) == "user-3"
+    head, payload, sig = token.split(".")
+    forged = f"{head}.{payload}.{sig[:-4]}{'AAAA' if not sig.endswith('AAAA') else 'BBBB'}"
+    misses = token_claims.misses
+    assert token_claims.get(forged) is None
+    assert token_claims.misses == misses + 1
+    with pytest.raises(JWTError):
+        decode_access_token(forged)
+    assert token_claims.get(forged) is None  # failures are never cached
+
+
+def test_keys_are_hmac_digests_not_the_token():
+    cache = TokenClaimCache(10)
+    token = create_access_token("user-4")
+    cache.set(token, "user-4", time.time() + 60)
+    (key, (digest, sub, _)), = cache._data.items()
+    assert sub == "user-4"
+    assert digest == hmac.new(cache._key, token.encode(), hashlib.sha256).digest()
+    assert key == digest[:16]
+    assert token.encode() not in (key, digest)
+    assert digest != hashlib.sha256(token.encode()).digest()  # keyed, not a plain hash
+    assert len(cache._key) == 32 and cache._key != TokenClaimCache(10)._key
+
+
+def test_size_cap_evicts_least_recently_used():
+    cache = TokenClaimCache(2)
+    exp = time.time() + 60
+    cache.set("a", "1", exp)
+    cache.set("b", "2", exp)
+    assert cache.get("a") == "1"
+    cache.set("c", "3", exp)
+    assert cache.get("b") is None
+    assert cache.get("a") == "1" and cache.get("c") == "3"
+    assert cache.stats()["evictions"] == 1
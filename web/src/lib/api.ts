@@ -81,12 +81,14 @@ export type IdeasPage = {
   total: number
   limit: number
   offset: number
+  next_cursor?: string | null
 }
 
 export const ideas = {
   list: (params: {
     limit?: number
     offset?: number
+    cursor?: string | null
     q?: string
     sort?: "created_at" | "score"
     order?: "asc" | "desc"
@@ -98,6 +100,7 @@ export const ideas = {
     const qs = new URLSearchParams()
     if (params.limit != null) qs.set("limit", String(params.limit))
     if (params.offset != null) qs.set("offset", String(params.offset))
+    if (params.cursor) qs.set("cursor", params.cursor)
     if (params.q) qs.set("q", params.q)
     if (params.sort) qs.set("sort", params.sort)
     if (params.order) qs.set("order", params.order)